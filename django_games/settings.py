@@ -122,3 +122,8 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/4.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Opening book of the bot's replies (see: python manage.py build_opening_book)
+WEB_GAMES_OPENING_BOOK = BASE_DIR / 'opening_book'
+# Bot's replies are cached only for the positions with not more items
+WEB_GAMES_MOVE_CACHE_MAX_ITEMS = 6
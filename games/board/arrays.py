@@ -0,0 +1,95 @@
+# IDE: PyCharm
+# Project: games
+# Path: games/board
+# File: arrays.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-25 (y-m-d) 10:30 AM
+from typing import Sequence, Type, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .axis import IAxis
+from .board import Board
+from ..items.items import BoardItem, PItem
+
+"""
+    grid = board.as_array((XItem, OItem))  # int8 [len(axis_y), len(axis_x)]: 0 - empty, 1 - XItem, 2 - OItem
+    has_line(grid, 1, 5)  # XItem has 5 in row
+    get_open_window_counts(grid, 1, 5)  # [windows without O items and with 0, 1, .. 5 X items]
+    board = Board.from_array(AsciiAxis(15), Int1Axis(15), grid, (XItem, OItem))
+
+# NumPy is optional, pure python code (games.vector, games.tictactoe) does not depend on this module.
+"""
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError('NumPy is required for the array representation of the board')
+
+
+def board_to_array(board: Board, item_classes: Sequence[Type[PItem]]) -> 'np.ndarray':
+    """Grid [iy, ix] of the codes: 0 - empty point, n - item_classes[n - 1]"""
+    _require_numpy()
+    res = np.zeros((len(board.axis_y), len(board.axis_x)), dtype=np.int8)
+    flat = res.reshape(-1)
+    for code, item_class in enumerate(item_classes, 1):
+        for point in board.positions_of(item_class):
+            flat[board.get_offset(*point)] = code
+    if np.count_nonzero(res) != len(board) - board.empty_count:
+        raise ValueError(f'There are items of the classes that are not in {list(item_classes)}')
+    return res
+
+
+def array_to_board(axis_x: IAxis, axis_y: IAxis, grid: 'np.ndarray',
+                   item_classes: Sequence[Type[BoardItem]], board_class: Type[Board] = Board) -> Board:
+    _require_numpy()
+    grid = np.asarray(grid)
+    if grid.shape != (len(axis_y), len(axis_x)):
+        raise ValueError(f'Expected the grid of shape {(len(axis_y), len(axis_x))}, got: {grid.shape}')
+    if grid.size:
+        for code in (int(grid.min()), int(grid.max())):
+            if not 0 <= code <= len(item_classes):
+                raise ValueError(f'Code {code} is not 0 or the code of item_classes (1..{len(item_classes)})')
+    classes = (None, *item_classes)
+    return board_class.from_cells(axis_x, axis_y, [classes[code] for code in grid.reshape(-1).tolist()])
+
+
+def get_window_sums(mask: 'np.ndarray', cnt_in_row: int) -> tuple[Optional['np.ndarray'], ...]:
+    """
+        Sums of mask (int or bool grid [iy, ix]) in each window of cnt_in_row points of the rows, columns,
+        back and forward diagonals (the order of LineTable.directions). Each result is indexed by
+        the top-left point of the window's bounding box, None if the window doesn't fit the grid.
+    """
+    _require_numpy()
+    mask = np.asarray(mask, dtype=np.int32)
+    size_y, size_x = mask.shape
+    ny, nx = size_y - cnt_in_row + 1, size_x - cnt_in_row + 1
+    row = sum(mask[:, i:nx + i] for i in range(cnt_in_row)) if nx > 0 else None
+    column = sum(mask[i:ny + i, :] for i in range(cnt_in_row)) if ny > 0 else None
+    back = forward = None
+    if nx > 0 and ny > 0:
+        back = sum(mask[i:ny + i, i:nx + i] for i in range(cnt_in_row))
+        forward = sum(mask[i:ny + i, cnt_in_row - 1 - i:nx + cnt_in_row - 1 - i] for i in range(cnt_in_row))
+    return row, column, back, forward
+
+
+def has_line(grid: 'np.ndarray', code: int, cnt_in_row: int) -> bool:
+    _require_numpy()
+    return any(sums is not None and bool((sums == cnt_in_row).any())
+               for sums in get_window_sums(grid == code, cnt_in_row))
+
+
+def get_open_window_counts(grid: 'np.ndarray', code: int, cnt_in_row: int) -> 'np.ndarray':
+    """Number of windows without the items of the other codes by the number of code items (0..cnt_in_row)"""
+    _require_numpy()
+    grid = np.asarray(grid)
+    res = np.zeros(cnt_in_row + 1, dtype=np.int64)
+    own_sums = get_window_sums(grid == code, cnt_in_row)
+    other_sums = get_window_sums((grid != 0) & (grid != code), cnt_in_row)
+    for own, other in zip(own_sums, other_sums):
+        if own is not None:
+            res += np.bincount(own[other == 0], minlength=cnt_in_row + 1)
+    return res
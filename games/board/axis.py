@@ -78,30 +78,29 @@ class AsciiAxis(IAxis):
     ord_range: tuple[tuple[int, int]] = ((ord('a'), ord('z')), (ord('A'), ord('Z')))
 
     def __init__(self, size: int):
+        self.__labels: tuple[str, ...] = ()
+        self.__positions: dict[str, int] = {}
         self.set_size(size)
 
+    def set_size(self, size: int) -> None:
+        super().set_size(size)
+        self.__labels = tuple(self.index_to_char(i) for i in range(len(self)))
+        self.__positions = {ch: i for i, ch in enumerate(self.__labels)}
+
     def get_max_size(self) -> int:
         return sum(ecode-bcode+1 for bcode, ecode in self.ord_range)
 
     def index(self, ch: str) -> int:
-        chcode = ord(ch)
-        tcnt = 0
-        for bcode, ecode in self.ord_range:
-            if bcode <= chcode <= ecode:
-                tcnt += chcode - bcode
-                if tcnt >= len(self):
-                    raise ValueError(f'Char should be in range [{self[0]}..{self[len(self)-1]}]: {ch}')
-                else:
-                    return tcnt
-            tcnt += ecode - bcode + 1
-        raise ValueError
+        try:
+            return self.__positions[ch]
+        except (KeyError, TypeError):
+            raise ValueError(f'Char should be in range [{self[0]}..{self[len(self)-1]}]: {ch}') from None
 
     def __contains__(self, ch: str) -> bool:
         try:
-            self.index(ch)
-        except ValueError:
+            return ch in self.__positions
+        except TypeError:
             return False
-        return True
 
     def index_to_char(self, i: int) -> str:
         if 0 > i or i >= len(self):
@@ -114,19 +113,42 @@ class AsciiAxis(IAxis):
                 return chr(ecode + idx1)
 
     def __getitem__(self, i: int) -> str:
-        return self.index_to_char(i)
+        if 0 > i or i >= len(self):
+            raise AxisIndexNotInRangeError(0, len(self)-1, i)
+        return self.__labels[i]
 
 
 class FixedAxis(IAxis):
 
     def __init__(self, keys: Sequence):
         self.__keys = keys
+        self.__labels: tuple = ()
+        self.__positions: dict[Any, int] = {}
         self.set_size(len(keys))
 
+    def set_size(self, size: int) -> None:
+        super().set_size(size)
+        self.__labels = tuple(self.__keys[:len(self)])
+        self.__positions = {}
+        for i, key in enumerate(self.__labels):
+            self.__positions.setdefault(key, i)
+
     def get_max_size(self) -> int:
         return len(self.__keys)
 
+    def index(self, key: Any) -> int:
+        try:
+            return self.__positions[key]
+        except (KeyError, TypeError):
+            raise ValueError(f'{key!r} is not in axis') from None
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            return key in self.__positions
+        except TypeError:
+            return False
+
     def __getitem__(self, i: int) -> Any:
         if i >= len(self) or i < 0:
             raise AxisIndexNotInRangeError(0, len(self)-1, i)
-        return self.__keys[i]
+        return self.__labels[i]
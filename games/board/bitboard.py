@@ -0,0 +1,121 @@
+# IDE: PyCharm
+# Project: games
+# Path: games/board
+# File: bitboard.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-12 (y-m-d) 7:40 PM
+
+from typing import Optional, Type
+
+from .axis import IAxis
+from .board import Board
+from ..items.items import PItem, TPoint, TPointX, TPointY
+
+"""
+    b = BitBoard(AsciiAxis(3), Int1Axis(3))
+    XItem(b, 'a', 1)
+    XItem(b, 'b', 2)
+    XItem(b, 'c', 3)
+    b.has_line(XItem, 3)  # True - back diagonal
+
+# Bits of the board 3x3 (stride is 4, the last bit in each row is a guard bit and always empty)
+#    abc
+# 1  0 1 2 (3)
+# 2  4 5 6 (7)
+# 3  8 9 10 (11)
+"""
+
+
+class BitBoard(Board):
+    """
+        Board that keeps the occupancy of each item class as int bitmask (one bit per point) in addition
+        to the items of Board. Bit of the point (x, y) is iy * (len(axis_x) + 1) + ix, where ix, iy are
+        positions on the axes. The extra (guard) bit at the end of each row is always empty, so shifting
+        the mask never wraps a line to the next row.
+        It is an opt-in board for the whole board queries (has_line, is_full, count, get_mask) only:
+        access to the points is the same as Board has and each change costs the mask update as well.
+        Players and search do not use it, they check the lines through the last move.
+    """
+
+    def __init__(self, axis_x: IAxis, axis_y: IAxis):
+        super().__init__(axis_x, axis_y)
+        self.__stride = len(axis_x) + 1
+        self.__full_mask = sum(((1 << len(axis_x)) - 1) << (iy * self.__stride) for iy in range(len(axis_y)))
+        self.__occupied = 0
+        self.__masks: dict[Type[PItem], int] = {}
+
+    @property
+    def stride(self) -> int:
+        return self.__stride
+
+    @property
+    def full_mask(self) -> int:
+        return self.__full_mask
+
+    def get_bit(self, x: TPointX, y: TPointY) -> int:
+        try:
+            return self.axis_y.index(y) * self.__stride + self.axis_x.index(x)
+        except (ValueError, TypeError):
+            self._validate_index(x, y)
+            raise
+
+    def __get_offset_bit(self, offset: int) -> int:
+        return offset + offset // len(self.axis_x)  # iy * stride + ix
+
+    def __set_bit(self, bit: int, old_value: Optional[PItem], value: PItem) -> None:
+        if old_value is not None:
+            self.__unset_bit(bit, old_value)
+        cls = type(value)
+        self.__masks[cls] = self.__masks.get(cls, 0) | 1 << bit
+        self.__occupied |= 1 << bit
+
+    def __unset_bit(self, bit: int, value: PItem) -> None:
+        self.__masks[type(value)] &= ~(1 << bit)
+        self.__occupied &= ~(1 << bit)
+
+    def _set(self, key: TPoint, offset: int, value: PItem) -> None:
+        self.__set_bit(self.__get_offset_bit(offset), self.get_at_offset(offset), value)
+        super()._set(key, offset, value)
+
+    def _bulk_set(self, placed: list[tuple[TPoint, int, PItem]]) -> None:
+        values: dict[int, PItem] = {}  # the same point can be in placed several times
+        for _, offset, value in placed:
+            old_value = values[offset] if offset in values else self.get_at_offset(offset)
+            self.__set_bit(self.__get_offset_bit(offset), old_value, value)
+            values[offset] = value
+        super()._bulk_set(placed)
+
+    def _delete(self, key: TPoint, offset: int) -> None:
+        value = self.get_at_offset(offset)
+        if value is None:
+            raise KeyError(offset)
+        self.__unset_bit(self.__get_offset_bit(offset), value)
+        super()._delete(key, offset)
+
+    def get_mask(self, item_class: Optional[Type[PItem]] = None) -> int:
+        """Returns the bitmask of the points occupied by item_class or by any item if item_class is None"""
+        if item_class is None:
+            return self.__occupied
+        return self.__masks.get(item_class, 0)
+
+    def count(self, item_class: Optional[Type[PItem]] = None) -> int:
+        return bin(self.get_mask(item_class)).count('1')
+
+    def is_full(self) -> bool:
+        return self.__occupied == self.__full_mask
+
+    def get_line_shifts(self) -> tuple[int, int, int, int]:
+        """Bit distances between the neighbour points of row, column, back and forward diagonals"""
+        return 1, self.__stride, self.__stride + 1, self.__stride - 1
+
+    def has_line(self, item_class: Type[PItem], cnt_in_row: int) -> bool:
+        mask = self.get_mask(item_class)
+        for shift in self.get_line_shifts():
+            res = mask
+            for i in range(1, cnt_in_row):
+                res &= mask >> shift * i
+                if not res:
+                    break
+            if res:
+                return True
+        return False
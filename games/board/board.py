@@ -5,11 +5,15 @@
 # Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
 # Created by ox23 at 2022-05-31 (y-m-d) 5:26 PM
 
+import inspect
+import random
+import weakref
 from abc import abstractmethod
-from typing import Optional, Sequence, Iterator
+from typing import Optional, Sequence, Iterator, Callable, Union, Iterable, Type
 
 from .axis import IAxis
-from ..items.items import BoardItem, PItem, TPointY, TPointX, TPoint
+from .zobrist import ZobristKeys
+from ..items.items import BoardItem, PItem, TPointY, TPointX, TPoint, ItemTriesToOccupyOccupiedPointError
 from ..renderer.renderer import IRender, CharRender, NewLineCharRender, HTMLRender
 
 """
@@ -84,6 +88,42 @@ class IBoard(Sequence):
     def get_row(self, y: int) -> tuple[Optional[BoardItem]]:
         ...
 
+    @abstractmethod
+    def subscribe(self, listener: 'TBoardListener') -> None:
+        ...
+
+    @abstractmethod
+    def unsubscribe(self, listener: 'TBoardListener') -> None:
+        ...
+
+    @property
+    @abstractmethod
+    def empty_count(self) -> int:
+        ...
+
+    @abstractmethod
+    def get_at(self, ix: int, iy: int) -> Optional[PItem]:
+        ...
+
+    @abstractmethod
+    def get_at_offset(self, offset: int) -> Optional[PItem]:
+        ...
+
+    @abstractmethod
+    def set_at(self, ix: int, iy: int, value: PItem) -> None:
+        ...
+
+    @abstractmethod
+    def delete_at(self, ix: int, iy: int) -> None:
+        ...
+
+    @abstractmethod
+    def random_empty_point(self) -> Optional[TPoint]:
+        ...
+
+
+TBoardListener = Callable[[IBoard, TPoint], None]
+
 
 class Board(IBoard):
     """
@@ -100,7 +140,14 @@ class Board(IBoard):
     def __init__(self, axis_x: IAxis, axis_y: IAxis):
         self.__axis_x = axis_x
         self.__axis_y = axis_y
-        self.__items = {}
+        self.__items: dict[int, PItem] = {}  # offset -> item
+        self.__points: dict[int, dict[TPoint, None]] = {}  # id(item) -> points of the item in order of placement
+        self.__positions: dict[Type[PItem], dict[TPoint, None]] = {}  # item class -> points in order of placement
+        self.__zobrist_hash = 0
+        # offsets of the empty points (in any order) and offset -> index in it, built on the first sampling
+        self.__empty: Optional[list[int]] = None
+        self.__empty_index: Optional[dict[int, int]] = None
+        self.__listeners: list[Union[weakref.WeakMethod, TBoardListener]] = []
 
     @property
     def axis_x(self) -> IAxis:
@@ -120,22 +167,215 @@ class Board(IBoard):
                 raise IndexError(msg.format(valname=valname, start=axis[0], end=axis[len(axis)-1], value=value))
 
     def __getitem__(self, key: TPoint) -> Optional[PItem]:
-        self._validate_index(*key)
-        return self.__items.get(key, None)
+        return self.__items.get(self._get_valid_offset(*key), None)
+
+    def get_offset(self, x: TPointX, y: TPointY) -> int:
+        """Returns the number of the point (x, y) in order of __iter__: iy * len(axis_x) + ix"""
+        return self.axis_y.index(y) * len(self.axis_x) + self.axis_x.index(x)
+
+    def _get_valid_offset(self, x: TPointX, y: TPointY) -> int:
+        try:
+            return self.get_offset(x, y)
+        except (ValueError, TypeError):
+            self._validate_index(x, y)
+            raise
+
+    def get_at(self, ix: int, iy: int) -> Optional[PItem]:
+        """Item on the point by the positions on the axes. There is no validation - for trusted callers only."""
+        return self.__items.get(iy * len(self.__axis_x) + ix)
+
+    def get_at_offset(self, offset: int) -> Optional[PItem]:
+        """Item on the point by offset iy * len(axis_x) + ix. There is no validation - for trusted callers only."""
+        return self.__items.get(offset)
+
+    def set_at(self, ix: int, iy: int, value: PItem) -> None:
+        self._set((self.__axis_x[ix], self.__axis_y[iy]), iy * len(self.__axis_x) + ix, value)
+
+    def delete_at(self, ix: int, iy: int) -> None:
+        self._delete((self.__axis_x[ix], self.__axis_y[iy]), iy * len(self.__axis_x) + ix)
+
+    @property
+    def zobrist_hash(self) -> int:
+        """64-bit Zobrist hash of the items on the board (depends on the point and the class of each item)"""
+        return self.__zobrist_hash
+
+    def __add_position(self, key: TPoint, value: PItem) -> None:
+        self.__points.setdefault(id(value), {})[key] = None
+        self.__positions.setdefault(type(value), {})[key] = None
+
+    def __remove_position(self, key: TPoint, value: PItem) -> None:
+        points = self.__points[id(value)]
+        del points[key]
+        if not points:
+            del self.__points[id(value)]
+        del self.__positions[type(value)][key]
+
+    def __add_empty(self, offset: int) -> None:
+        if self.__empty is not None:
+            self.__empty_index[offset] = len(self.__empty)
+            self.__empty.append(offset)
+
+    def __remove_empty(self, offset: int) -> None:
+        if self.__empty is not None:
+            # swap with the last one, so removing is O(1)
+            i, last = self.__empty_index.pop(offset), self.__empty.pop()
+            if last != offset:
+                self.__empty[i] = last
+                self.__empty_index[last] = i
+
+    @property
+    def empty_count(self) -> int:
+        return len(self) - len(self.__items)
+
+    def random_empty_point(self) -> Optional[TPoint]:
+        """Uniformly random empty point or None if the board is full"""
+        if self.__empty is None:
+            occupied = self.__items
+            self.__empty = [offset for offset in range(len(self)) if offset not in occupied]
+            self.__empty_index = {offset: i for i, offset in enumerate(self.__empty)}
+        if not self.__empty:
+            return None
+        iy, ix = divmod(random.choice(self.__empty), len(self.axis_x))
+        return self.axis_x[ix], self.axis_y[iy]
+
+    def _set(self, key: TPoint, offset: int, value: PItem) -> None:
+        """Stores the item on the point (key and offset should match each other) and notifies the listeners"""
+        old_value = self.__items.get(offset)
+        if old_value is not value:  # the item that is set again on its point keeps its place in positions_of
+            if old_value is not None:
+                self.__zobrist_hash ^= ZobristKeys.get_for(type(old_value))[offset]
+                self.__remove_position(key, old_value)
+            else:
+                self.__remove_empty(offset)
+            self.__items[offset] = value
+            self.__add_position(key, value)
+            self.__zobrist_hash ^= ZobristKeys.get_for(type(value))[offset]
+        self._notify(key)
+
+    def _delete(self, key: TPoint, offset: int) -> None:
+        value = self.__items.pop(offset)
+        self.__remove_position(key, value)
+        self.__add_empty(offset)
+        self.__zobrist_hash ^= ZobristKeys.get_for(type(value))[offset]
+        self._notify(key)
 
     def __setitem__(self, key: TPoint, value: PItem):
-        self._validate_index(*key)
-        self.__items[key] = value
+        self._set(key, self._get_valid_offset(*key), value)
 
     def __delitem__(self, key: TPoint):
-        self._validate_index(*key)
-        del self.__items[key]
+        self._delete(key, self._get_valid_offset(*key))
+
+    def _bulk_set(self, placed: list[tuple[TPoint, int, PItem]]) -> None:
+        """Stores (point, offset, item) without validation and notification"""
+        items, hash_value = self.__items, self.__zobrist_hash
+        for key, offset, value in placed:
+            old_value = items.get(offset)
+            if old_value is value:
+                continue
+            if old_value is not None:
+                hash_value ^= ZobristKeys.get_for(type(old_value))[offset]
+                self.__remove_position(key, old_value)
+            else:
+                self.__remove_empty(offset)
+            items[offset] = value
+            self.__add_position(key, value)
+            hash_value ^= ZobristKeys.get_for(type(value))[offset]
+        self.__zobrist_hash = hash_value
+
+    def bulk_load(self, cells: Iterable[tuple[TPoint, Type[BoardItem]]], replace: bool = False) -> list[BoardItem]:
+        """
+            Places the new items of the item classes on the points. All points are validated before any item
+            is placed, items are created by BoardItem.new_unplaced. The occupied point (on the board or twice
+            in cells) raises ItemTriesToOccupyOccupiedPointError unless replace is True, then the item replaces it.
+        """
+        positions_x = {x: ix for ix, x in enumerate(self.axis_x)}
+        positions_y = {y: iy for iy, y in enumerate(self.axis_y)}
+        size_x, placed, offsets = len(self.axis_x), [], set()
+        for (x, y), item_class in cells:
+            try:
+                offset = positions_y[y] * size_x + positions_x[x]
+            except (KeyError, TypeError):
+                self._validate_index(x, y)
+                raise
+            item = item_class.new_unplaced(self, x, y)
+            if not replace and (offset in offsets or offset in self.__items):
+                raise ItemTriesToOccupyOccupiedPointError(item)
+            offsets.add(offset)
+            placed.append(((x, y), offset, item))
+
+        self._bulk_set(placed)
+        for key, _, _ in placed:
+            self._notify(key)
+        return [value for _, _, value in placed]
+
+    @classmethod
+    def from_cells(cls, axis_x: IAxis, axis_y: IAxis, cells: Sequence[Optional[Type[BoardItem]]]) -> 'Board':
+        """cells - item class or None for each point in order of __iter__ (offset iy * len(axis_x) + ix)"""
+        if len(cells) != len(axis_x) * len(axis_y):
+            raise ValueError(f'Expected {len(axis_x) * len(axis_y)} cells, got: {len(cells)}')
+        res = cls(axis_x, axis_y)
+        labels_x, labels_y, size_x = tuple(axis_x), tuple(axis_y), len(axis_x)
+        res._bulk_set([((labels_x[offset % size_x], labels_y[offset // size_x]), offset,
+                        item_class.new_unplaced(res, labels_x[offset % size_x], labels_y[offset // size_x]))
+                       for offset, item_class in enumerate(cells) if item_class is not None])
+        return res
+
+    def as_array(self, item_classes: Sequence[Type[PItem]]) -> 'numpy.ndarray':
+        """int8 grid [iy, ix] of the codes: 0 - empty, n - item_classes[n - 1]. NumPy is required."""
+        from .arrays import board_to_array
+        return board_to_array(self, item_classes)
+
+    @classmethod
+    def from_array(cls, axis_x: IAxis, axis_y: IAxis, grid: 'numpy.ndarray',
+                   item_classes: Sequence[Type[BoardItem]]) -> 'Board':
+        from .arrays import array_to_board
+        return array_to_board(axis_x, axis_y, grid, item_classes, cls)
+
+    def subscribe(self, listener: TBoardListener) -> None:
+        """listener(board, point) will be called after each change of the point.
+           Bound methods are held by weak reference, so the subscribed object is not kept alive by the board."""
+        if inspect.ismethod(listener):
+            listener = weakref.WeakMethod(listener)
+        self.__listeners.append(listener)
+
+    def unsubscribe(self, listener: TBoardListener) -> None:
+        self.__listeners = [lsnr for lsnr in self.__listeners
+                            if (lsnr() if isinstance(lsnr, weakref.WeakMethod) else lsnr) not in (listener, None)]
+
+    def _notify(self, key: TPoint) -> None:
+        alive = True
+        for lsnr in self.__listeners:
+            if isinstance(lsnr, weakref.WeakMethod):
+                lsnr = lsnr()
+                if lsnr is None:
+                    alive = False
+                    continue
+            lsnr(self, key)
+
+        if not alive:
+            self.__listeners = [lsnr for lsnr in self.__listeners
+                                if not isinstance(lsnr, weakref.WeakMethod) or lsnr() is not None]
 
     def index(self, value: PItem) -> TPoint:
-        for k, v in self.__items.items():
-            if value is v:
-                return k
-        raise ValueError
+        """The first point of the item (in order of placement), the same item can be placed on several points"""
+        points = self.__points.get(id(value))
+        if not points:
+            raise ValueError
+        return next(iter(points))
+
+    def positions_of(self, item_class: Type[PItem]) -> tuple[TPoint, ...]:
+        """Points of the items of item_class (exactly, not subclasses) in order of placement"""
+        return tuple(self.__positions.get(item_class, ()))
+
+    def items(self) -> Iterator[tuple[TPoint, PItem]]:
+        """Only the occupied points, the board can be changed during the iteration"""
+        return iter(tuple(self.iter_items()))
+
+    def iter_items(self) -> Iterator[tuple[TPoint, PItem]]:
+        """The same as items() without a copy, the board must not be changed during the iteration"""
+        axis_x, axis_y, size_x = self.__axis_x, self.__axis_y, len(self.__axis_x)
+        for offset, value in self.__items.items():
+            yield (axis_x[offset % size_x], axis_y[offset // size_x]), value
 
     def __iter__(self) -> Iterator[Optional[PItem]]:
         for y in self.axis_y:
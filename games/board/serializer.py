@@ -4,12 +4,77 @@
 # File: serializer.py
 # Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
 # Created by ox23 at 2022-06-22 (y-m-d) 9:05 PM
+import io
 import json
-import sys
+import struct
+from typing import Union, Type, Iterator, Iterable, TextIO
 
-from .axis import IAxis
+from .axis import IAxis, IntAxis, Int1Axis, AsciiAxis, FixedAxis
+from .bitboard import BitBoard
 from .board import Board
-from ..items.items import BoardItem
+from ..items.items import BoardItem, XItem, OItem, ShipItem, TPoint
+
+"""
+    data = BinaryBoardSerializer(board).dumps()  # b'GB\x01...' - header + 2 bits per point
+    board = BinaryBoardSerializer().loads(data).board
+
+    with open('games.jsonl', 'w') as fp:  # one board after another
+        for board in boards:
+            JSONBoardSerializer(board).dump(fp)
+    with open('games.jsonl') as fp:
+        for item in JSONBoardSerializer().iter_load(fp):  # items of the first board, each is placed when it is read
+            ...
+
+    class_registry.register(MyItem)  # the classes that are not registered can't be loaded
+
+# Binary format (little endian):
+#   magic b'GB', version (B), size_x (H), size_y (H), number of classes (B)
+#   classes: board, axis_x, axis_y, item classes (up to 3) - each is length (B) + utf-8 class path
+#   points: 4 points per byte (offset iy * size_x + ix, the lowest bits first),
+#           0 - empty, n - item class number n from the item classes
+"""
+
+
+class ClassRegistry:
+    """Bounded class path -> class mapping of the classes that can be restored by the serializers"""
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.__classes: dict[str, type] = {}
+
+    @staticmethod
+    def get_path(cls: type) -> str:
+        return '.'.join((*cls.__module__.split('.'), cls.__name__))
+
+    def register(self, *classes: Type) -> None:
+        for cls in classes:
+            path = self.get_path(cls)
+            if path not in self.__classes and len(self.__classes) >= self.maxsize:
+                raise ValueError(f'Registry is full ({self.maxsize}), can\'t register: {path}')
+            self.__classes[path] = cls
+
+    def unregister(self, cls: Type) -> None:
+        self.__classes.pop(self.get_path(cls), None)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.__classes
+
+    def __len__(self) -> int:
+        return len(self.__classes)
+
+    def resolve(self, path: str) -> type:
+        try:
+            return self.__classes[path]
+        except KeyError:
+            raise ModuleNotFoundError(f'Class is not registered: {path}') from None
+
+
+class_registry = ClassRegistry()
+class_registry.register(IntAxis, Int1Axis, AsciiAxis, FixedAxis, Board, BitBoard, BoardItem, XItem, OItem, ShipItem)
+
+
+def _class2str(obj):
+    return ClassRegistry.get_path(type(obj))
 
 
 class JSONBoardSerializer:
@@ -17,26 +82,16 @@ class JSONBoardSerializer:
     class_name_key = 'class'
     class_args_key = 'args'
     class_kwargs_key = 'kwargs'
+    registry: ClassRegistry = class_registry
 
     def __init__(self, board: Board = None) -> None:
         self.board = board
 
     def __str2class(self, cls: str):
-        res = globals().get(cls)
-        if res is None:
-            mod_str, _, cls = cls.rpartition('.')
-            mod = sys.modules.get(mod_str)
-            if mod is None:
-                raise ModuleNotFoundError(f'Can\'t find module: {mod_str}')
-            try:
-                res = getattr(mod, cls)
-            except AttributeError:
-                raise ModuleNotFoundError(f'Can\'t find class: {cls} in module {mod.__name__}')
-        return res
+        return self.registry.resolve(cls)
 
     def __class2str(self, obj):
-        cls = type(obj)
-        return '.'.join((*cls.__module__.split('.'), cls.__name__))
+        return _class2str(obj)
 
     def _dumps_axis(self, axis: IAxis) -> str:
         result = {self.class_name_key: self.__class2str(axis),
@@ -82,21 +137,134 @@ class JSONBoardSerializer:
         result = cls(board, **info[self.class_kwargs_key])
         return result
 
-    def dumps(self) -> str:
-        result = [self._dumps_board()]
-
-        items = self.board.__dict__.get('_Board__items')
-        for point, item in items.items():
+    def iter_dumps(self) -> Iterator[str]:
+        """Yields the board line and the line of each item"""
+        yield self._dumps_board()
+        for point, item in self.board.iter_items():
             if point != (item.x, item.y):
                 AssertionError('The x, y positions of the Item does not correlate to index in board items.')
-            result.append(self._dumps_item(item))
+            yield self._dumps_item(item)
 
-        return "\n".join(result)
+    def dumps(self) -> str:
+        return "\n".join(self.iter_dumps())
+
+    def dump(self, fp: TextIO) -> None:
+        """Writes line by line, the board ends with an empty line so the boards can be dumped one by one into fp"""
+        for line in self.iter_dumps():
+            fp.write(line)
+            fp.write('\n')
+        fp.write('\n')
+
+    def _loads_cell(self, json_item: str) -> tuple[TPoint, Type[BoardItem]]:
+        info = json.loads(json_item)
+        kwargs = info[self.class_kwargs_key]
+        return (kwargs['x'], kwargs['y']), self.__str2class(info[self.class_name_key])
+
+    def _place_cell(self, point: TPoint, item_class: Type[BoardItem]) -> BoardItem:
+        """The occupied point raises ItemTriesToOccupyOccupiedPointError whatever the item class is"""
+        return self.board.bulk_load(((point, item_class), ))[0]
+
+    def iter_load(self, fp: Iterable[str]) -> Iterator[BoardItem]:
+        """
+            Restores self.board from the first line, then reads the items line by line until the empty line
+            (end of the board in dump()) or the end of fp. Each item is placed and yielded before the next line is read.
+        """
+        lines = iter(fp)
+        json_board = next(lines, '')
+        if not json_board.strip():
+            raise EOFError('There is no board to load')
+        self.board = self._loads_board(json_board)
+        for json_item in lines:
+            if not json_item.strip():
+                break
+            yield self._place_cell(*self._loads_cell(json_item))
+
+    def load(self, fp: Iterable[str]) -> 'JSONBoardSerializer':
+        for _ in self.iter_load(fp):
+            pass
+        return self
 
     def loads(self, json_board: str) -> 'JSONBoardSerializer':
-        json_board, *json_items = json_board.split('\n')
-        res_board = self._loads_board(json_board)
-        for item in json_items:
-            self._loads_item(res_board, item)
+        return self.load(io.StringIO(json_board))
+
+
+class BinaryBoardSerializer:
+    """Compact counterpart of JSONBoardSerializer, axes are restored by class and size as JSONBoardSerializer does"""
+
+    magic = b'GB'
+    version = 1
+    header = struct.Struct('<2sBHHB')
+    bits_per_point = 2
+    max_item_classes = (1 << bits_per_point) - 1
+    registry: ClassRegistry = class_registry
+
+    def __init__(self, board: Board = None) -> None:
+        self.board = board
+
+    def _dumps_classes(self, class_paths: list[str]) -> bytes:
+        res = bytearray()
+        for path in class_paths:
+            path = path.encode()
+            if len(path) > 0xff:
+                raise ValueError(f'Class path is longer than 255 bytes: {path.decode()}')
+            res.append(len(path))
+            res.extend(path)
+        return bytes(res)
+
+    def _loads_classes(self, data: memoryview, pos: int, cnt: int) -> tuple[list[type], int]:
+        res = []
+        for _ in range(cnt):
+            if pos >= len(data) or pos + 1 + data[pos] > len(data):
+                raise ValueError(f'Truncated data: {cnt} classes are expected')
+            size = data[pos]
+            res.append(self.registry.resolve(bytes(data[pos + 1:pos + 1 + size]).decode()))
+            pos += 1 + size
+        return res, pos
+
+    def dumps(self) -> bytes:
+        board = self.board
+        size_x, size_y = len(board.axis_x), len(board.axis_y)
+        if size_x > 0xffff or size_y > 0xffff:
+            raise ValueError(f'Sizes of the board should not be greater than 65535: {size_x}, {size_y}')
+        item_classes: dict[str, int] = {}
+        points = bytearray((size_x * size_y + 3) // 4)
+        for point, item in board.items():
+            code = item_classes.setdefault(_class2str(item), len(item_classes) + 1)
+            if code > self.max_item_classes:
+                raise ValueError(f'Only {self.max_item_classes} item classes can be serialized: {list(item_classes)}')
+            offset = board.get_offset(*point)
+            points[offset >> 2] |= code << ((offset & 3) * self.bits_per_point)
+
+        class_paths = [_class2str(board), _class2str(board.axis_x), _class2str(board.axis_y), *item_classes]
+        header = self.header.pack(self.magic, self.version, size_x, size_y, len(class_paths))
+        return b''.join((header, self._dumps_classes(class_paths), points))
+
+    def loads(self, data: Union[bytes, bytearray, memoryview]) -> 'BinaryBoardSerializer':
+        data = memoryview(data)
+        if len(data) < self.header.size:
+            raise ValueError(f'Truncated data: {len(data)} bytes is less than the header')
+        magic, version, size_x, size_y, cnt = self.header.unpack_from(data)
+        if magic != self.magic or version != self.version:
+            raise ValueError(f'Unsupported format: {bytes(magic)} version {version}')
+        if not 3 <= cnt <= 3 + self.max_item_classes:
+            raise ValueError(f'Wrong number of classes: {cnt}')
+        (board_cls, axis_x_cls, axis_y_cls, *item_classes), pos = self._loads_classes(data, self.header.size, cnt)
+        points_size = (size_x * size_y + 3) // 4
+        if len(data) - pos != points_size:
+            raise ValueError(f'Expected {points_size} bytes of the points for the board {size_x}x{size_y}, '
+                             f'got: {len(data) - pos}')
+
+        cells = [None] * (size_x * size_y)
+        for i, byte in enumerate(data[pos:]):
+            offset = i << 2
+            while byte:
+                code = byte & self.max_item_classes
+                if code:
+                    if code > len(item_classes) or offset >= len(cells):
+                        raise ValueError(f'Wrong point code {code} at offset {offset}')
+                    cells[offset] = item_classes[code - 1]
+                byte >>= self.bits_per_point
+                offset += 1
+        res_board = board_cls.from_cells(axis_x_cls(size_x), axis_y_cls(size_y), cells)
         self.board = res_board
         return self
@@ -0,0 +1,107 @@
+# IDE: PyCharm
+# Project: games
+# Path: games/board
+# File: symmetry.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-21 (y-m-d) 10:20 AM
+import functools
+from typing import NamedTuple, Optional
+
+from .board import Board
+from .zobrist import ZobristKeys
+from ..items.items import TPoint
+
+"""
+    b = Board(AsciiAxis(3), Int1Axis(3))
+    XItem(b, 'c', 3)
+    canonical = get_canonical(b)
+    canonical.hash  # the same for all 8 rotations/reflections of the position
+    point = to_canonical_point(b, ('b', 1), canonical.symmetry)  # the move in the canonical position
+    from_canonical_point(b, point, canonical.symmetry)  # ('b', 1)
+    transform(b, canonical.symmetry)  # new Board with the canonical position
+
+# Symmetries of the square board: identity, mirror x, mirror y, rotation 180,
+# transpose, rotation 90, rotation 270, anti-transpose. Not square board has only the first 4.
+"""
+
+
+class Symmetry(NamedTuple):
+    """perm[offset] - offset of the point in the transformed position, inverse - reverse mapping"""
+
+    perm: tuple[int, ...]
+    inverse: tuple[int, ...]
+
+    def apply(self, offset: int) -> int:
+        return self.perm[offset]
+
+    def revert(self, offset: int) -> int:
+        return self.inverse[offset]
+
+
+class CanonicalPosition(NamedTuple):
+    hash: int  # the smallest Zobrist hash between the symmetric positions
+    symmetry: Symmetry  # position -> canonical position
+
+
+@functools.lru_cache(maxsize=64)
+def get_symmetries(size_x: int, size_y: int) -> tuple[Symmetry, ...]:
+    """Symmetries of the size_x * size_y board (offsets are iy * size_x + ix), the first one is identity"""
+    mx, my = size_x - 1, size_y - 1
+    funcs = [lambda ix, iy: (ix, iy), lambda ix, iy: (mx - ix, iy),
+             lambda ix, iy: (ix, my - iy), lambda ix, iy: (mx - ix, my - iy)]
+    if size_x == size_y:
+        funcs.extend([lambda ix, iy: (iy, ix), lambda ix, iy: (my - iy, ix),
+                      lambda ix, iy: (iy, mx - ix), lambda ix, iy: (my - iy, mx - ix)])
+
+    res = []
+    for func in funcs:
+        perm = [0] * (size_x * size_y)
+        for offset in range(size_x * size_y):
+            nix, niy = func(*reversed(divmod(offset, size_x)))
+            perm[offset] = niy * size_x + nix
+        inverse = [0] * len(perm)
+        for offset, noffset in enumerate(perm):
+            inverse[noffset] = offset
+        res.append(Symmetry(tuple(perm), tuple(inverse)))
+    return tuple(res)
+
+
+def get_board_symmetries(board: Board) -> tuple[Symmetry, ...]:
+    return get_symmetries(len(board.axis_x), len(board.axis_y))
+
+
+def get_canonical(board: Board, max_items: Optional[int] = None) -> Optional[CanonicalPosition]:
+    """
+        Canonical position is the symmetric one with the smallest Zobrist hash (ties go to the first symmetry).
+        Returns None if there are more than max_items items on the board.
+    """
+    items = [(board.get_offset(*point), ZobristKeys.get_for(type(item))) for point, item in board.items()]
+    if max_items is not None and len(items) > max_items:
+        return None
+
+    res = None
+    for symmetry in get_board_symmetries(board):
+        perm, hash_value = symmetry.perm, 0
+        for offset, keys in items:
+            hash_value ^= keys[perm[offset]]
+        if res is None or hash_value < res.hash:
+            res = CanonicalPosition(hash_value, symmetry)
+    return res
+
+
+def to_canonical_point(board: Board, point: TPoint, symmetry: Symmetry) -> TPoint:
+    iy, ix = divmod(symmetry.apply(board.get_offset(*point)), len(board.axis_x))
+    return board.axis_x[ix], board.axis_y[iy]
+
+
+def from_canonical_point(board: Board, point: TPoint, symmetry: Symmetry) -> TPoint:
+    iy, ix = divmod(symmetry.revert(board.get_offset(*point)), len(board.axis_x))
+    return board.axis_x[ix], board.axis_y[iy]
+
+
+def transform(board: Board, symmetry: Symmetry) -> Board:
+    """New board (with the same axes) where each item is placed on the transformed point"""
+    res = type(board)(board.axis_x, board.axis_y)
+    for point, item in board.items():
+        type(item)(res, *to_canonical_point(board, point, symmetry))
+    return res
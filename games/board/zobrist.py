@@ -0,0 +1,67 @@
+# IDE: PyCharm
+# Project: games
+# Path: games/board
+# File: zobrist.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-19 (y-m-d) 9:45 AM
+import random
+import threading
+from typing import Type
+
+from ..items.items import PItem
+
+"""
+    keys = ZobristKeys.get_for(XItem)
+    keys[0] ^ keys[12]  # hash of the board with XItem on the points with offsets 0 and 12
+
+    b = Board(AsciiAxis(3), Int1Axis(3))
+    XItem(b, 'a', 1)
+    b.zobrist_hash == ZobristKeys.get_for(XItem)[0]  # True
+"""
+
+ZOBRIST_SEED = 'games.zobrist'
+
+
+class ZobristKeys:
+    """
+        Random 64-bit keys for the points (by offset) of one kind of item (usually item class).
+        Keys are generated deterministically (the same in all processes) from the kind, so the hashes
+        can be stored and compared between the processes. The keys of the boards up to 50x50 are generated
+        at once, the next ones are taken on demand from the same random generator: the key of an offset depends on
+        the order of the draws, so the extension is done by one thread at a time.
+        Keys do not depend on the board shape, so the hashes of the different shapes should not be mixed.
+    """
+
+    # number of the keys generated by __init__ - the largest board (50x50)
+    preallocated: int = 50 * 50
+    __registry: dict[str, 'ZobristKeys'] = {}
+    __class_registry: dict[Type[PItem], 'ZobristKeys'] = {}
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.__random = random.Random(f'{ZOBRIST_SEED}:{kind}')
+        self.__keys: list[int] = [self.__random.getrandbits(64) for _ in range(self.preallocated)]
+        self.__lock = threading.Lock()
+
+    def __getitem__(self, offset: int) -> int:
+        keys = self.__keys
+        if offset >= len(keys):
+            with self.__lock:
+                if offset >= len(keys):
+                    keys.extend(self.__random.getrandbits(64) for _ in range(offset + 1 - len(keys)))
+        return keys[offset]
+
+    @classmethod
+    def get(cls, kind: str) -> 'ZobristKeys':
+        res = cls.__registry.get(kind)
+        if res is None:
+            res = cls.__registry[kind] = cls(kind)
+        return res
+
+    @classmethod
+    def get_for(cls, item_class: Type[PItem]) -> 'ZobristKeys':
+        res = cls.__class_registry.get(item_class)
+        if res is None:
+            res = cls.get('.'.join((item_class.__module__, item_class.__qualname__)))
+            cls.__class_registry[item_class] = res
+        return res
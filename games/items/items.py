@@ -34,6 +34,13 @@ class BoardItem(PItem):
     def __post_init__(self):
         self.board[self.x, self.y] = self
 
+    @classmethod
+    def new_unplaced(cls, board: 'IBoard', x: TPointX, y: TPointY) -> 'BoardItem':
+        """Creates the item without __post_init__ (it is not placed on the board), see: Board.bulk_load"""
+        res = cls.__new__(cls)
+        res.board, res.x, res.y = board, x, y
+        return res
+
     def render(self):
         print(str(self.id), end='')
 
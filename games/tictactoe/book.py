@@ -0,0 +1,167 @@
+# IDE: PyCharm
+# Project: games
+# Path: games/tictactoe
+# File: book.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-20 (y-m-d) 5:15 PM
+import dbm
+import shelve
+import threading
+from collections import OrderedDict
+from typing import Optional, NamedTuple, Type, Callable
+
+from ..board.board import Board
+from ..board.symmetry import Symmetry, get_canonical
+from ..items.items import TPoint
+
+"""
+    cache = MoveCache(maxsize=10000, path='/var/lib/games/opening_book', max_items=4)
+    TicTacToePlayerX.move_cache = cache  # move_suggestion() looks into the cache first
+
+    # offline
+    build_book(lambda: Board(AsciiAxis(15), Int1Axis(15)), TicTacToePlayerX, TicTacToePlayerY, 5, 3, cache)
+"""
+
+
+class PositionKey(NamedTuple):
+    size_x: int
+    size_y: int
+    cnt_in_row: int
+    item_id: str  # side to move
+    hash: int  # the smallest Zobrist hash between the symmetric positions
+
+    def __str__(self) -> str:
+        return f'{self.size_x}x{self.size_y}:{self.cnt_in_row}:{self.item_id}:{self.hash:016x}'
+
+
+class MoveCache:
+    """
+        Position -> move cache. Keys are PositionKey, so the positions that differ only by rotation
+        or reflection share the same move. In-process LRU of maxsize entries, optionally backed
+        by the shelve on disk (path, opened with flag). Only positions with not more than max_items items are cached.
+        The views of all requests use one cache: get() reorders the LRU and put() evicts from it, and
+        the shelve can't be used by two threads at once, so both are done under the lock.
+        Symmetries of the positions are in games.board.symmetry.
+    """
+
+    def __init__(self, maxsize: int = 10000, path: Optional[str] = None,
+                 max_items: Optional[int] = None, flag: str = 'c') -> None:
+        self.maxsize = maxsize
+        self.path = path
+        self.max_items = max_items
+        self.flag = flag
+        self.__cache: OrderedDict[str, int] = OrderedDict()
+        self.__store: Optional[shelve.Shelf] = None
+        self.__lock = threading.RLock()
+
+    def _get_store(self) -> Optional[shelve.Shelf]:
+        if self.__store is None and self.path is not None:
+            try:
+                self.__store = shelve.open(self.path, self.flag)
+            except dbm.error:
+                self.path = None  # there is no book (yet) - works as in-process cache only
+        return self.__store
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__store is not None:
+                self.__store.close()
+                self.__store = None
+
+    def __len__(self) -> int:
+        return len(self.__cache)
+
+    def get_key(self, board: Board, cnt_in_row: int, item_id: str) -> Optional[tuple[PositionKey, Symmetry]]:
+        """Returns the key and the symmetry to the canonical position. None if the position is not cacheable."""
+        canonical = get_canonical(board, self.max_items)
+        if canonical is None:
+            return None
+        key = PositionKey(len(board.axis_x), len(board.axis_y), cnt_in_row, item_id, canonical.hash)
+        return key, canonical.symmetry
+
+    def get(self, board: Board, cnt_in_row: int, item_id: str) -> Optional[TPoint]:
+        res = self.get_key(board, cnt_in_row, item_id)
+        if res is None:
+            return None
+
+        key, symmetry = res
+        skey = str(key)
+        with self.__lock:
+            offset = self.__cache.get(skey)
+            if offset is not None:
+                self.__cache.move_to_end(skey)
+            else:
+                store = self._get_store()
+                if store is None or skey not in store:
+                    return None
+                offset = store[skey]
+                self._put(skey, offset)
+
+        iy, ix = divmod(symmetry.revert(offset), key.size_x)
+        return board.axis_x[ix], board.axis_y[iy]
+
+    def _put(self, skey: str, offset: int) -> None:
+        with self.__lock:
+            self.__cache[skey] = offset
+            self.__cache.move_to_end(skey)
+            if len(self.__cache) > self.maxsize:
+                self.__cache.popitem(last=False)
+
+    def put(self, board: Board, cnt_in_row: int, item_id: str, point: TPoint, store: bool = False) -> None:
+        """store - write to the disk store as well (if path is defined)"""
+        res = self.get_key(board, cnt_in_row, item_id)
+        if res is None:
+            return
+
+        key, symmetry = res
+        skey = str(key)
+        offset = symmetry.apply(board.get_offset(*point))
+        with self.__lock:
+            self._put(skey, offset)
+            if store and self._get_store() is not None:
+                self.__store[skey] = offset
+
+
+def build_book(board_factory: Callable[[], Board],
+               player_class: Type['ITicTacToePlayer'],
+               bot_class: Type['ITicTacToePlayer'],
+               cnt_in_row: int, plies: int, cache: MoveCache) -> int:
+    """
+        Walks all (up to symmetry) positions of the first plies moves where player_class moves first
+        and bot_class replies by move_suggestion(). Bot replies are stored in cache (and its disk store).
+        Returns the number of the stored positions.
+    """
+    from .player import PlayerWon
+
+    board = board_factory()
+    player, bot = player_class(board, cnt_in_row), bot_class(board, cnt_in_row)
+    bot.move_cache = None  # the replies should be computed, not taken from the cache
+    seen = set()
+
+    def walk(ply: int) -> int:
+        if ply + 1 >= plies:  # there is no bot's ply
+            return 0
+
+        res = 0
+        for x, y in list(board):
+            if board[x, y] is not None:
+                continue
+            item = player.item_class(board, x, y)
+            key = cache.get_key(board, cnt_in_row, bot.item_class.id)
+            if key is not None and key[0] not in seen and not player.is_won(item) and not bot.is_board_full():
+                seen.add(key[0])
+                point = bot.move_suggestion()
+                cache.put(board, cnt_in_row, bot.item_class.id, point, True)
+                res += 1
+                bot_item = bot.item_class(board, *point)
+                try:
+                    bot.play(bot_item)
+                except PlayerWon:
+                    pass
+                else:
+                    res += walk(ply + 2)
+                del board[bot_item.x, bot_item.y]
+            del board[x, y]
+        return res
+
+    return walk(0)
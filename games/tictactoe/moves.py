@@ -4,12 +4,13 @@
 # File: moves.py
 # Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
 # Created by ox23 at 2022-06-19 (y-m-d) 9:44 PM
-import functools
+import heapq
 import random
 from typing import Optional
 
 from ..items.items import TPoint
-from ..moves import IMoveResolver, MoveResolved
+from ..moves import IMoveResolver
+from .scoring import WindowScorer, LineScore
 from ..tictactoe.vector import ITicTacToeVectorProvider
 from ..vector.vector import TVector
 from ..vector.intersection import IntersectionPoints, IIntersectionPoint, IntersectionPoint
@@ -17,36 +18,38 @@ from ..vector.intersection import IntersectionPoints, IIntersectionPoint, Inters
 
 class TicTacToeWinMove(IMoveResolver):
 
-    def test_win_case(self, vector: TVector) -> Optional[TPoint]:
-
-        if len(tuple(val for val in vector.values() if val is not None)) >= self.vector_provider.cnt_in_row - 1:
-            # tests X..X..X on 3X in row worse than ..XX...
-
-            def reduce_func(items, item_next):
-                if len(items) < self.vector_provider.cnt_in_row - 1:
-                    items.append(item_next)
-                    return items
-                items.append(item_next)
-
-                empties = tuple((k, v) for k, v in items if v is None)
-                if len(empties) == 1:
-                    raise MoveResolved(empties[0][0], items)
-
-                return items[1:]
+    def get_scorer(self) -> WindowScorer:
+        # vectors of ITicTacToeVectorProvider contain only own items and empty points
+        return WindowScorer(None, self.vector_provider.cnt_in_row)
 
-            try:
-                functools.reduce(reduce_func, vector.items(), [])
-            except MoveResolved as res:
-                return res.key
-        return
+    def test_win_case(self, vector: TVector) -> Optional[TPoint]:
+        # tests X..X..X on 3X in row worse than ..XX...
+        wins = self.get_scorer().score(vector.items()).wins
+        return wins[0] if wins else None
 
     def resolve(self) -> Optional[TPoint]:
-        for v in self.vector_provider.provide():
+        for v in self.vector_provider.iter_vectors():  # stops at the first winning point
             res = self.test_win_case(v)
             if res:
                 return res
 
 
+class TicTacToeDoubleThreatMove(TicTacToeWinMove):
+    """
+        Searches the point that makes two winning points at once (opponent can block only one of them).
+        It is not used by TicTacToePlayerX by default, override get_move_dispatcher() to put it before the rating.
+    """
+
+    def resolve(self) -> Optional[TPoint]:
+        scorer, score = self.get_scorer(), LineScore()
+        for v in self.vector_provider.iter_vectors():
+            scorer.score(v.items(), score)
+
+        threats = score.get_double_threats()
+        if threats:
+            return max(threats, key=lambda point: len(score.makes[point]))
+
+
 class TicTacToeOpponentWinMove(IMoveResolver):
 
     def __init__(self, vector_provider: ITicTacToeVectorProvider, opponent_id: str) -> None:
@@ -80,23 +83,34 @@ class TicTacToeIntersectionPoints(IntersectionPoints):
                 res += self.calc_vector_rate(v)
         return res
 
-    def get_most_rated(self) -> list[Optional[IIntersectionPoint]]:
-        # will search empty point with most rated intersection
-        res = []
+    def get_rates(self) -> dict[TPoint, int]:
+        """Rates of all points, rate of each vector is calculated once and added to each its point"""
+        res, vector_rates = {}, {}
         for (x, y), ip in self.points.items():
             if ip.point != (x, y):
                 raise AssertionError(f'Integrity violation: IntersectionPoint.point{ip.point} must be ({x}, {y})')
 
-            rate = self.calc_intersection_point_rate(ip)
-            if len(res):
-                if res[0][0] > rate:
-                    continue
-                elif res[0][0] < rate:
-                    res.clear()
+            rate = 0
+            for v in ip.vectors:
+                vrate = vector_rates.get(id(v))
+                if vrate is None:
+                    vrate = vector_rates[id(v)] = self.calc_vector_rate(v)
+                rate += vrate
+            res[ip.point] = rate
+        return res
 
-            res.append((rate, ip))
+    def get_top_rated(self, k: int) -> list[IIntersectionPoint]:
+        """k most rated points, the points of the equal rate keep the order of adding"""
+        rates = self.get_rates()
+        return [self.points[point] for point in heapq.nlargest(k, rates, key=rates.__getitem__)]
 
-        return [ip for rate, ip in res]
+    def get_most_rated(self) -> list[Optional[IIntersectionPoint]]:
+        # will search empty point with most rated intersection
+        rates = self.get_rates()
+        if not rates:
+            return []
+        max_rate = max(rates.values())
+        return [self.points[point] for point, rate in rates.items() if rate == max_rate]
 
 
 class TicTacToeIntersectionMove(IMoveResolver):
@@ -109,8 +123,4 @@ class TicTacToeIntersectionMove(IMoveResolver):
 class TicTacToeRandomMove(IMoveResolver):
 
     def resolve(self) -> Optional[TPoint]:
-        b = self.vector_provider.board
-        empties = [(x, y) for x, y in b if b[x, y] is None]
-        if empties:
-            return random.choice(empties)
-        return None
+        return self.vector_provider.board.random_empty_point()
@@ -10,6 +10,8 @@ from typing import Type, Optional, Union
 
 from ..moves import MoveDispatcher
 from .moves import TicTacToeWinMove, TicTacToeOpponentWinMove, TicTacToeIntersectionMove, TicTacToeRandomMove
+from .book import MoveCache
+from .search import TicTacToeSearchMove
 from .vector import TicTacToeVectorProvider
 from ..board.board import IBoard
 from ..items.items import XItem, PItem, TPointX, TPointY, OItem, BoardItem, TPoint
@@ -78,6 +80,10 @@ class TicTacToePlayerX(ITicTacToePlayer):
     item_class: Type[PItem] = XItem
     opponent_item_class: Type[PItem] = OItem
     vector_provider_class = TicTacToeVectorProvider
+    # shared position -> move cache (opening book), move_suggestion() looks into it first
+    move_cache: Optional[MoveCache] = None
+    # steps (on axis positions) of row, column, back and forward diagonal - the same as VectorPoints do
+    line_steps: tuple[tuple[int, int], ...] = ((1, 0), (0, 1), (1, 1), (-1, 1))
 
     def __init__(self, board: IBoard, cnt_in_row=3) -> None:
         self._vector_provider = self.vector_provider_class(board, self.item_class.id, cnt_in_row)
@@ -99,19 +105,67 @@ class TicTacToePlayerX(ITicTacToePlayer):
         return self._vector_provider.cnt_in_row
 
     def move_suggestion(self):
-        self._vector_provider.clear_cache()
-        return self.move_dispatcher.resolve()
+        if self.move_cache is None:
+            return self.move_dispatcher.resolve()
+
+        res = self.move_cache.get(self.board, self.cnt_in_row, self.item_class.id)
+        if res is None:
+            res = self.move_dispatcher.resolve()
+            if res is not None:
+                self.move_cache.put(self.board, self.cnt_in_row, self.item_class.id, res)
+        return res
 
     def is_board_full(self, throw_exc=False) -> Optional[bool]:
-        res = len([pitem for pitem in self.board if self.board[pitem] is None]) == 0
-        if throw_exc:
+        res = self.board.empty_count == 0
+        if res and throw_exc:
             raise PlayerBoardFull()
         return res
 
+    def get_won_line(self, last_move: BoardItem) -> Optional[list[tuple[TPoint, Optional[BoardItem]]]]:
+        """Walks only the row, column and diagonals through the last_move, not further than cnt_in_row
+           from it, instead of building all vectors of the board."""
+        board, cnt_in_row = self.board, self.cnt_in_row
+        axis_x, axis_y = board.axis_x, board.axis_y
+        if type(board[last_move.x, last_move.y]) is not self.item_class:
+            return None
+
+        ix, iy = axis_x.index(last_move.x), axis_y.index(last_move.y)
+        len_x, len_y = len(axis_x), len(axis_y)
+
+        def get_point_info(_ix: int, _iy: int) -> Optional[tuple[TPoint, Optional[BoardItem]]]:
+            if 0 <= _ix < len_x and 0 <= _iy < len_y:
+                item = board.get_at(_ix, _iy)
+                if type(item) is self.item_class:
+                    return (axis_x[_ix], axis_y[_iy]), item
+
+        for dx, dy in self.line_steps:
+            bix, biy = ix, iy
+            for _ in range(cnt_in_row - 1):
+                if get_point_info(bix - dx, biy - dy) is None:
+                    break
+                bix, biy = bix - dx, biy - dy
+
+            pis = []
+            while len(pis) < cnt_in_row and (pi := get_point_info(bix, biy)) is not None:
+                pis.append(pi)
+                bix, biy = bix + dx, biy + dy
+            if len(pis) == cnt_in_row:
+                return pis
+
+        return None
+
     def is_won(self,
                last_move: Optional[BoardItem] = None,
                throw_exc=False) -> Union[bool, list[tuple[TPoint, Optional[BoardItem]]], None]:
 
+        if last_move:
+            pis = self.get_won_line(last_move)
+            if pis is None:
+                return False
+            if throw_exc:
+                raise PlayerWon(pis)
+            return pis
+
         def red_func(pis: list[tuple[TPoint, Optional[BoardItem]]], pi: tuple[TPoint, Optional[BoardItem]]):
             if len(pis) < self.cnt_in_row:
                 if type(pi[1]) is self.item_class:
@@ -123,12 +177,7 @@ class TicTacToePlayerX(ITicTacToePlayer):
             return pis
 
         try:
-            if last_move:
-                vectors = (v for v in self._vector_provider.provide() if (last_move.x, last_move.y) in v)
-            else:
-                vectors = (v for v in self._vector_provider.provide())
-
-            for v in vectors:
+            for v in self._vector_provider.iter_vectors():
                 functools.reduce(red_func, v.items(), [])
 
         except PlayerWon as err:
@@ -146,10 +195,29 @@ class TicTacToePlayerX(ITicTacToePlayer):
             bi = x
         else:
             bi = self.item_class(self.board, x, y)
-        self._vector_provider.clear_cache()
         self.is_won(bi, True)
 
 
 class TicTacToePlayerY(TicTacToePlayerX):
     item_class: Type[PItem] = OItem
     opponent_item_class: Type[PItem] = XItem
+
+
+class TicTacToeSearchPlayerX(TicTacToePlayerX):
+    """Uses alpha-beta search instead of the intersection rating, search_time_limit is seconds per move"""
+
+    search_max_depth: int = 4
+    search_time_limit: float = 0.5
+
+    def get_move_dispatcher(self) -> MoveDispatcher:
+        mr = [TicTacToeWinMove,
+              TicTacToeOpponentWinMove(self._vector_provider, self.opponent_item_class.id),
+              TicTacToeSearchMove(self._vector_provider, self.search_max_depth, self.search_time_limit),
+              TicTacToeRandomMove]
+
+        return MoveDispatcher(self._vector_provider, *mr)
+
+
+class TicTacToeSearchPlayerY(TicTacToeSearchPlayerX):
+    item_class: Type[PItem] = OItem
+    opponent_item_class: Type[PItem] = XItem
@@ -0,0 +1,127 @@
+# IDE: PyCharm
+# Project: games
+# Path: games/tictactoe
+# File: scoring.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-16 (y-m-d) 3:25 PM
+from collections import deque
+from typing import Iterable, Optional
+
+from ..items.items import TPoint, PItem
+
+"""
+    scorer = WindowScorer('X', 3)
+    score = scorer.score({('a', 1): None, ('b', 1): x_item, ('c', 1): None, ('d', 1): None}.items())
+    score.wins  # [] - there is no window with 2 X and 1 empty point
+    score.makes  # {('a', 1): {('c', 1)}, ('c', 1): {('a', 1), ('d', 1)}, ('d', 1): {('c', 1)}}
+    score.get_double_threats()  # [('c', 1)] - X on c1 makes 2 winning points at once
+"""
+
+EMPTY, OWN, OPPONENT = 0, 1, 2
+
+
+class LineScore:
+    """
+        wins - empty points that complete cnt_in_row (the window has cnt_in_row-1 own items and 1 empty point).
+        makes - empty point -> the winning points that appear if own item is placed on it.
+        is_open - some line has two (or more) winning points.
+    """
+
+    __slots__ = ('_wins', 'makes', '_open')
+
+    def __init__(self) -> None:
+        self._wins: dict[TPoint, None] = {}
+        self.makes: dict[TPoint, set[TPoint]] = {}
+        self._open = False
+
+    @property
+    def wins(self) -> list[TPoint]:
+        return list(self._wins)
+
+    @property
+    def is_open(self) -> bool:
+        """Two (or more) winning points on one line - like an open four for 5 in row, can't be blocked by one move"""
+        return self._open
+
+    def set_open(self) -> None:
+        self._open = True
+
+    def add_win(self, point: TPoint) -> None:
+        self._wins[point] = None
+
+    def add_makes(self, point: TPoint, win_point: TPoint) -> None:
+        self.makes.setdefault(point, set()).add(win_point)
+
+    def update(self, other: 'LineScore') -> 'LineScore':
+        self._wins.update(other._wins)
+        self._open = self._open or other._open
+        for point, win_points in other.makes.items():
+            self.makes.setdefault(point, set()).update(win_points)
+        return self
+
+    def get_double_threats(self) -> list[TPoint]:
+        """Returns the empty points that make two (or more) winning points at once"""
+        return [point for point, win_points in self.makes.items() if len(win_points) > 1]
+
+
+class WindowScorer:
+    """
+        Slides the window of cnt_in_row points once over the line and keeps the running counts
+        of own, opponent and empty points in the window.
+        If item_id is None all items are own - the vectors are already filtered (ITicTacToeVectorProvider).
+    """
+
+    def __init__(self, item_id: Optional[str], cnt_in_row: int) -> None:
+        self.item_id = item_id
+        self.cnt_in_row = cnt_in_row
+
+    def get_kind(self, item: Optional[PItem]) -> int:
+        if item is None:
+            return EMPTY
+        return OWN if self.item_id is None or item.id == self.item_id else OPPONENT
+
+    def score(self, vector: Iterable[tuple[TPoint, Optional[PItem]]],
+              result: Optional[LineScore] = None) -> LineScore:
+        """vector is the points of line with items in order, like TVector.items()"""
+        if result is None:
+            result = LineScore()
+
+        cnt_in_row = self.cnt_in_row
+        points, kinds = [], []
+        own = opponent = 0
+        empties = deque()  # positions of the empty points in the window
+        line_wins = set()
+        for i, (point, item) in enumerate(vector):
+            kind = self.get_kind(item)
+            points.append(point)
+            kinds.append(kind)
+            if kind == EMPTY:
+                empties.append(i)
+            elif kind == OWN:
+                own += 1
+            else:
+                opponent += 1
+
+            if i >= cnt_in_row:  # the point leaves the window
+                kind = kinds[i - cnt_in_row]
+                if kind == EMPTY:
+                    empties.popleft()
+                elif kind == OWN:
+                    own -= 1
+                else:
+                    opponent -= 1
+
+            if i < cnt_in_row - 1 or opponent:
+                continue
+
+            if own == cnt_in_row - 1:
+                line_wins.add(points[empties[0]])
+                result.add_win(points[empties[0]])
+            elif own == cnt_in_row - 2:
+                point, win_point = points[empties[0]], points[empties[1]]
+                result.add_makes(point, win_point)
+                result.add_makes(win_point, point)
+
+        if len(line_wins) > 1:
+            result.set_open()
+        return result
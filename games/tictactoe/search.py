@@ -0,0 +1,289 @@
+# IDE: PyCharm
+# Project: games
+# Path: games/tictactoe
+# File: search.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-18 (y-m-d) 11:10 AM
+import functools
+import threading
+import time
+from typing import Optional
+
+from ..board.zobrist import ZobristKeys
+from ..items.items import TPoint
+from ..moves import IMoveResolver
+from ..vector.lines import LineTable, get_line_table
+from .moves import TicTacToeIntersectionPoints
+from .vector import ITicTacToeVectorProvider
+
+"""
+    provider = TicTacToeVectorProvider(board, XItem.id, 5)
+    TicTacToeSearchMove(provider, max_depth=6, time_limit=0.5).resolve()  # -> ('h', 8)
+
+# Sides in the SearchState: 0 - empty point, 1 - the player (vector_provider.item_id), 2 - any other item
+"""
+
+EMPTY, OWN, OPPONENT = 0, 1, 2
+SIDE_TO_MOVE_KEYS = (0, 0, ZobristKeys.get('search.side_to_move')[0])
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class TranspositionTable:
+    """
+        Bounded position -> (depth, flag, value, move) storage. The oldest entries are evicted first.
+        The eviction finds the oldest key and deletes it in two steps: two searches of the web request threads
+        putting into the full table at once would both delete the same key (KeyError), so put() takes the lock.
+    """
+
+    EXACT, LOWER, UPPER = 0, 1, 2
+
+    def __init__(self, maxsize: int = 1 << 16) -> None:
+        self.maxsize = maxsize
+        self.entries: dict[int, tuple[int, int, int, Optional[int]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: int) -> Optional[tuple[int, int, int, Optional[int]]]:
+        return self.entries.get(key)
+
+    def put(self, key: int, depth: int, flag: int, value: int, move: Optional[int]) -> None:
+        with self._lock:
+            if key not in self.entries and len(self.entries) >= self.maxsize:
+                del self.entries[next(iter(self.entries))]
+            self.entries[key] = (depth, flag, value, move)
+
+
+@functools.lru_cache(maxsize=64)
+def get_transposition_table(size_x: int, size_y: int, cnt_in_row: int, item_id: str) -> TranspositionTable:
+    """The entries stay valid as the items are added, the searches of the next moves and games reuse them"""
+    return TranspositionTable()
+
+
+class SearchState:
+    """
+        Flat state of the board for the search: side of each point and the counts of the own and
+        opponent items in each window of the LineTable. Evaluation (from the OWN point of view)
+        and Zobrist hash are updated incrementally on make/unmake.
+    """
+
+    def __init__(self, table: LineTable, sides: list[int]) -> None:
+        self.table = table
+        self.cells = [EMPTY] * len(sides)
+        self.counts = (None, [0] * table.window_count, [0] * table.window_count)
+        self.weights = tuple(10 ** i if i < table.cnt_in_row else 0 for i in range(table.cnt_in_row + 1))
+        self.keys = (None, ZobristKeys.get('search.own'), ZobristKeys.get('search.opponent'))
+        self.hash = 0
+        self.score = 0
+        self.stones: dict[int, None] = {}
+        for offset, side in enumerate(sides):
+            if side != EMPTY:
+                self.make(offset, side)
+
+    def get_window_value(self, window_id: int) -> int:
+        own, opponent = self.counts[OWN][window_id], self.counts[OPPONENT][window_id]
+        if own and opponent:
+            return 0
+        return self.weights[own] - self.weights[opponent]
+
+    def make(self, offset: int, side: int) -> bool:
+        """Places side on the point. Returns True if the side has cnt_in_row items in a window."""
+        self.cells[offset] = side
+        self.hash ^= self.keys[side][offset]
+        self.stones[offset] = None
+        counts, cnt_in_row, won = self.counts[side], self.table.cnt_in_row, False
+        for window_id in self.table.get_cell_windows(offset):
+            self.score -= self.get_window_value(window_id)
+            counts[window_id] += 1
+            self.score += self.get_window_value(window_id)
+            won = won or counts[window_id] == cnt_in_row
+        return won
+
+    def unmake(self, offset: int) -> None:
+        side = self.cells[offset]
+        self.cells[offset] = EMPTY
+        self.hash ^= self.keys[side][offset]
+        del self.stones[offset]
+        counts = self.counts[side]
+        for window_id in self.table.get_cell_windows(offset):
+            self.score -= self.get_window_value(window_id)
+            counts[window_id] -= 1
+            self.score += self.get_window_value(window_id)
+
+    def get_priority(self, offset: int) -> int:
+        """Rough move ordering: how much the point adds to the both sides' windows that are still alive"""
+        res = 0
+        own, opponent = self.counts[OWN], self.counts[OPPONENT]
+        for window_id in self.table.get_cell_windows(offset):
+            if not opponent[window_id]:
+                res += self.weights[own[window_id]]
+            if not own[window_id]:
+                res += self.weights[opponent[window_id]]
+        return res
+
+    def get_candidates(self) -> list[int]:
+        """Empty points next to the items, ordered by priority"""
+        size_x, size_y = self.table.size_x, self.table.size_y
+        res = set()
+        for offset in self.stones:
+            ix, iy = self.table.get_ixy(offset)
+            for nix in range(max(ix - 1, 0), min(ix + 2, size_x)):
+                for niy in range(max(iy - 1, 0), min(iy + 2, size_y)):
+                    noffset = niy * size_x + nix
+                    if self.cells[noffset] == EMPTY:
+                        res.add(noffset)
+        return sorted(res, key=self.get_priority, reverse=True)
+
+
+class TicTacToeSearchMove(IMoveResolver):
+    """
+        Depth-limited negamax with alpha-beta pruning over the points next to the items,
+        iterative deepening until max_depth or time_limit (seconds) is reached.
+        Root moves are ordered by TicTacToeIntersectionPoints rating.
+    """
+
+    win_score = 1 << 40
+    # values beyond it are wins (losses) found at some ply, the evaluation is always less
+    win_bound = win_score >> 1
+    check_time_every = 256
+
+    def __init__(self, vector_provider: ITicTacToeVectorProvider,
+                 max_depth: int = 4, time_limit: float = 0.5) -> None:
+        super().__init__(vector_provider)
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self._deadline = 0.0
+        self._nodes = 0
+
+    def get_transposition_table(self, table: LineTable) -> TranspositionTable:
+        return get_transposition_table(table.size_x, table.size_y, table.cnt_in_row, self.vector_provider.item_id)
+
+    def get_state(self, table: LineTable) -> SearchState:
+        board, item_id = self.vector_provider.board, self.vector_provider.item_id
+        sides = []
+        for item in map(board.get_at_offset, range(table.size_x * table.size_y)):
+            sides.append(EMPTY if item is None else OWN if item.id == item_id else OPPONENT)
+        return SearchState(table, sides)
+
+    def get_root_moves(self, state: SearchState) -> list[int]:
+        board = self.vector_provider.board
+        ips = TicTacToeIntersectionPoints.create(self.vector_provider)
+        rates = {}
+        for (x, y), rate in ips.get_rates().items():
+            rates[state.table.get_offset(board.axis_x.index(x), board.axis_y.index(y))] = rate
+
+        moves = state.get_candidates()
+        if not moves:
+            moves = [offset for offset, side in enumerate(state.cells) if side == EMPTY]
+        moves.sort(key=lambda offset: rates.get(offset, 0), reverse=True)
+        return moves
+
+    def _to_tt_value(self, value: int, ply: int) -> int:
+        """Win (loss) values are stored as the distance from the position, not from the root"""
+        if value >= self.win_bound:
+            return value + ply
+        if value <= -self.win_bound:
+            return value - ply
+        return value
+
+    def _from_tt_value(self, value: int, ply: int) -> int:
+        if value >= self.win_bound:
+            return value - ply
+        if value <= -self.win_bound:
+            return value + ply
+        return value
+
+    def _check_time(self) -> None:
+        self._nodes += 1
+        if self._nodes % self.check_time_every == 0 and time.monotonic() > self._deadline:
+            raise SearchTimeout
+
+    def _negamax(self, state: SearchState, tt: TranspositionTable,
+                 depth: int, alpha: int, beta: int, side: int, ply: int) -> int:
+        self._check_time()
+
+        key = state.hash ^ SIDE_TO_MOVE_KEYS[side]
+        entry, tt_move, alpha_orig = tt.get(key), None, alpha
+        if entry is not None:
+            entry_depth, flag, value, tt_move = entry
+            value = self._from_tt_value(value, ply)
+            if entry_depth >= depth:
+                if flag == tt.EXACT:
+                    return value
+                elif flag == tt.LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        if depth == 0:
+            return state.score if side == OWN else -state.score
+
+        moves = state.get_candidates()
+        if not moves:
+            return 0
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+        best, best_move = -self.win_score * 2, None
+        for move in moves:
+            if state.make(move, side):
+                value = self.win_score - ply
+            else:
+                value = -self._negamax(state, tt, depth - 1, -beta, -alpha, OWN + OPPONENT - side, ply + 1)
+            state.unmake(move)
+
+            if value > best:
+                best, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        flag = tt.UPPER if best <= alpha_orig else tt.LOWER if best >= beta else tt.EXACT
+        tt.put(key, depth, flag, self._to_tt_value(best, ply), best_move)
+        return best
+
+    def _search_root(self, state: SearchState, tt: TranspositionTable,
+                     moves: list[int], depth: int) -> tuple[int, int]:
+        alpha, beta = -self.win_score * 2, self.win_score * 2
+        best_move = moves[0]
+        for move in moves:
+            if state.make(move, OWN):
+                value = self.win_score
+            else:
+                value = -self._negamax(state, tt, depth - 1, -beta, -alpha, OPPONENT, 1)
+            state.unmake(move)
+            if value > alpha:
+                alpha, best_move = value, move
+        return alpha, best_move
+
+    def resolve(self) -> Optional[TPoint]:
+        self._deadline, self._nodes = time.monotonic() + self.time_limit, 0
+        board = self.vector_provider.board
+        table = get_line_table(len(board.axis_x), len(board.axis_y), self.vector_provider.cnt_in_row)
+        state = self.get_state(table)
+        moves = self.get_root_moves(state)
+        if not moves:
+            return None
+
+        tt = self.get_transposition_table(table)
+        best_move = moves[0]
+        for depth in range(1, self.max_depth + 1):
+            try:
+                value, move = self._search_root(state, tt, moves, depth)
+            except SearchTimeout:
+                break  # the state is inconsistent now, but it is not used anymore
+            best_move = move
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(value) >= self.win_score - self.max_depth:
+                break
+
+        ix, iy = table.get_ixy(best_move)
+        return board.axis_x[ix], board.axis_y[iy]
@@ -5,10 +5,12 @@
 # Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
 # Created by ox23 at 2022-06-15 (y-m-d) 9:18 AM
 
-from typing import Iterable, Type, Optional
+from typing import Iterable, Iterator, Type, Optional
 
 from ..board.board import IBoard
-from ..items.items import TPoint
+from ..items.items import TPoint, PItem
+from ..vector.lines import LineTable, get_line_table
+from ..vector.segment import Segment
 from ..vector.vector import (IVectorProvider, TVector, RowVectorProvider,
                              ColumnVectorProvider, BackDiagonalVectorProvider, ForwardDiagonalVectorProvider)
 
@@ -28,14 +30,16 @@ class ITicTacToeVectorProvider(TicTacToeVectorProviderMixin, IVectorProvider):
            Each Item in list is dict where values is integer weights of this vector point.
            Implements - 'business logic' """
 
-        result = []
         vector_points = tuple(vector_points)
         if len(vector_points) < self.cnt_in_row:
-            return result
+            return []
+        return self.extract_item_vectors((point, self.board[point]) for point in vector_points)
 
+    def extract_item_vectors(self, vector_items: Iterable[tuple[TPoint, Optional[PItem]]]) -> list[TVector]:
+        """The same as extract_vectors but the items of the points are already taken from the board"""
+        result = []
         res = {}
-        for x, y in vector_points:
-            item = self.board[x, y]
+        for (x, y), item in vector_items:
             if item is None or item.id == self.item_id:
                 res[x, y] = item
             else:
@@ -80,18 +84,114 @@ class TicTacToeForwardDiagonalVectorProvider(ITicTacToeVectorProvider, ForwardDi
 
 
 class TicTacToeVectorProvider(TicTacToeVectorProviderMixin, IVectorProvider):
+    """Keeps the vectors of each line (row, column, diagonal) separately and listens to the board changes.
+       When a point is changed only the lines that pass through it are dropped and recomputed on demand.
+       The points of the lines are taken from the LineTable that is shared by all boards of the same shape,
+       the partial providers that walk other lines (see get_line_direction) are walked by themselves."""
 
     partial_vector_provider_classes: Iterable[Type[ITicTacToeVectorProvider]] = (
         TicTacToeRowVectorProvider, TicTacToeColumnVectorProvider,
         TicTacToeBackDiagonalVectorProvider, TicTacToeForwardDiagonalVectorProvider
     )
+    # partial providers which lines are the lines of the LineTable in the direction of their step
+    line_table_provider_classes: tuple[Type[ITicTacToeVectorProvider], ...] = (
+        TicTacToeRowVectorProvider, TicTacToeColumnVectorProvider,
+        TicTacToeBackDiagonalVectorProvider, TicTacToeForwardDiagonalVectorProvider
+    )
+    # methods of the partial provider that the LineTable path doesn't call - a provider that overrides
+    # any of them is walked by itself
+    line_table_provider_methods: tuple[str, ...] = (
+        'provide_start_points', 'provide_line', 'extract_vectors', 'extract_item_vectors'
+    )
+    # vectors are Segment views over the board instead of TVector dicts
+    use_segments: bool = False
 
     def __init__(self: IVectorProvider, board: IBoard, item_id: str, cnt_in_row: int = 3) -> None:
         super().__init__(board, item_id, cnt_in_row)
-        self.__cache: Optional[list[TVector]] = None
+        # (direction of the LineTable lines or None, provider) in order of partial_vector_provider_classes
+        self.__providers: list[tuple[Optional[int], ITicTacToeVectorProvider]] = []
+        for provider_class in self.partial_vector_provider_classes:
+            provider = provider_class(self.board, self.item_id, self.cnt_in_row)
+            self.__providers.append((self.get_line_direction(provider), provider))
+        self.__line_table: Optional[LineTable] = None
+        self.__direction_lines: dict[int, list[int]] = {}
+        self.__cache: dict[int, list[TVector]] = {}
+        # the vectors of the providers that are walked by themselves: index in __providers -> start point -> vectors
+        self.__provider_cache: dict[int, dict[TPoint, list[TVector]]] = {}
+        self.__vectors: Optional[list[TVector]] = None
+        self.board.subscribe(self.on_board_changed)
+
+    def get_line_direction(self, provider: ITicTacToeVectorProvider) -> Optional[int]:
+        """
+            Direction of the LineTable that has the same lines and vectors as provider or None if the provider
+            has other vector points class or overrides any of line_table_provider_methods.
+        """
+        provider_type = type(provider)
+        for provider_class in self.line_table_provider_classes:
+            if provider.get_vector_points_class() is provider_class.vector_points_class and all(
+                    getattr(provider_type, name) is getattr(provider_class, name)
+                    for name in self.line_table_provider_methods):
+                return LineTable.directions.index(provider_class.vector_points_class.step)
+        return None
 
     def clear_cache(self):
-        self.__cache = None
+        self.__line_table = None
+        self.__direction_lines = {}
+        self.__cache = {}
+        self.__provider_cache = {}
+        self.__vectors = None
+
+    def get_line_table(self) -> LineTable:
+        return get_line_table(len(self.board.axis_x), len(self.board.axis_y), self.cnt_in_row)
+
+    def _get_line_table(self) -> LineTable:
+        if self.__line_table is None:
+            self.__line_table = table = self.get_line_table()
+            for line_id in range(table.line_count):
+                self.__direction_lines.setdefault(table.get_line_direction(line_id), []).append(line_id)
+        return self.__line_table
+
+    def get_line_points(self, line_id: int) -> list[TPoint]:
+        axis_x, axis_y = self.board.axis_x, self.board.axis_y
+        return [(axis_x[ix], axis_y[iy])
+                for ix, iy in map(self.__line_table.get_ixy, self.__line_table.get_line(line_id))]
+
+    def provide_line_segments(self, line_id: int) -> list[Segment]:
+        """The same runs of the own items and empty points as extract_vectors makes, but as Segment"""
+        table, board, item_id, cnt_in_row = self.__line_table, self.board, self.item_id, self.cnt_in_row
+        offsets, direction = table.get_line(line_id), table.get_line_direction(line_id)
+        result, start = [], 0
+        for i, offset in enumerate(offsets):
+            item = board.get_at_offset(offset)
+            if item is not None and item.id != item_id:
+                if i - start >= cnt_in_row:
+                    result.append(Segment(board, line_id, offsets[start], i - start, direction))
+                start = i + 1
+        if len(offsets) - start >= cnt_in_row:
+            result.append(Segment(board, line_id, offsets[start], len(offsets) - start, direction))
+        return result
+
+    def provide_line(self, line_id: int) -> list[TVector]:
+        direction = self.__line_table.get_line_direction(line_id)
+        provider = next((provider for d, provider in self.__providers if d == direction), None)
+        if provider is None:
+            return []
+        if self.use_segments:
+            return self.filter_vectors(self.provide_line_segments(line_id))
+        # the offsets are known, so the items are read by offset without translation to labels and back
+        items = map(self.board.get_at_offset, self.__line_table.get_line(line_id))
+        return self.filter_vectors(provider.extract_item_vectors(zip(self.get_line_points(line_id), items)))
+
+    def on_board_changed(self, board: IBoard, point: TPoint) -> None:
+        self.__vectors = None
+        self.__provider_cache = {}
+        if not self.__cache:
+            return
+
+        x, y = point
+        offset = self.__line_table.get_offset(self.board.axis_x.index(x), self.board.axis_y.index(y))
+        for line_id in self.__line_table.get_cell_lines(offset):
+            self.__cache.pop(line_id, None)
 
     def filter_vectors(self, vectors: list[TVector]) -> list[TVector]:
         """Returns list of vectors from vectors passed as parameter.
@@ -99,9 +199,36 @@ class TicTacToeVectorProvider(TicTacToeVectorProviderMixin, IVectorProvider):
            Implements - 'business logic' """
         return vectors
 
+    def _iter_table_vectors(self, direction: int) -> Iterator[TVector]:
+        cache = self.__cache
+        for line_id in self.__direction_lines.get(direction, ()):
+            vectors = cache.get(line_id)
+            if vectors is None:
+                vectors = cache[line_id] = self.provide_line(line_id)
+            yield from vectors
+
+    def _iter_provider_vectors(self, index: int, provider: ITicTacToeVectorProvider) -> Iterator[TVector]:
+        cache = self.__provider_cache.setdefault(index, {})
+        for x, y in provider.provide_start_points():
+            vectors = cache.get((x, y))
+            if vectors is None:
+                vectors = cache[x, y] = self.filter_vectors(provider.provide_line(x, y))
+            yield from vectors
+
+    def iter_vectors(self) -> Iterator[TVector]:
+        """Lines are computed (and cached) only when the iteration reaches them"""
+        if self.__vectors is not None:
+            yield from self.__vectors
+            return
+
+        self._get_line_table()
+        for index, (direction, provider) in enumerate(self.__providers):
+            if direction is None:
+                yield from self._iter_provider_vectors(index, provider)
+            else:
+                yield from self._iter_table_vectors(direction)
+
     def provide(self) -> list[TVector]:
-        if self.__cache is None:
-            self.__cache = []
-            for provider_class in self.partial_vector_provider_classes:  # walk by rows
-                self.__cache.extend(self.filter_vectors(provider_class(self.board, self.item_id, self.cnt_in_row).provide()))
-        return self.__cache
+        if self.__vectors is None:
+            self.__vectors = list(self.iter_vectors())
+        return self.__vectors
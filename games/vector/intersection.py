@@ -4,7 +4,7 @@
 # File: intersection.py
 # Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
 # Created by ox23 at 2022-06-20 (y-m-d) 9:30 AM
-import functools
+import heapq
 import random
 from dataclasses import dataclass, field
 from typing import Collection, Iterator, Optional, Type, Callable, Iterable
@@ -15,8 +15,14 @@ from ..items.items import TPoint
 
 @dataclass
 class IIntersectionPoint(Collection):
+    """
+        vectors keep the order of adding, membership is tested by identity of the vector (id -> None),
+        size is the total number of points of the vectors (it's kept up to date on adding)
+    """
     point: TPoint
     vectors: list[TVector] = field(default_factory=list, init=False, repr=False, )
+    _vector_ids: dict[int, None] = field(default_factory=dict, init=False, repr=False, compare=False)
+    size: int = field(default=0, init=False, compare=False)
 
     def __len__(self) -> int:
         return len(self.vectors)
@@ -26,18 +32,22 @@ class IIntersectionPoint(Collection):
             yield v
 
     def __contains__(self, __vector: TVector) -> bool:
-        return __vector in self.vectors
+        return id(__vector) in self._vector_ids
 
 
 class IntersectionPoint(IIntersectionPoint):
 
     def clear(self) -> 'IntersectionPoint':
         self.vectors = []
+        self._vector_ids = {}
+        self.size = 0
         return self
 
     def add(self, vector: TVector) -> 'IntersectionPoint':
         if vector not in self and self.point in vector:
+            self._vector_ids[id(vector)] = None
             self.vectors.append(vector)
+            self.size += len(vector)
         return self
 
 
@@ -63,20 +73,12 @@ class IntersectionPoints:
 
     def get_largest_list(self) -> list[Optional[IIntersectionPoint]]:
         """ tests max count (number) intersections of vectors """
+        max_size = max((ip.size for ip in self.points.values()), default=None)
+        return [ip for ip in self.points.values() if ip.size == max_size]
 
-        def red_func(ips: list[IntersectionPoint], ip: IntersectionPoint):
-            if not len(ips):
-                ips.append(ip)
-            else:
-                ipc, ipfc = (sum(1 for v in ip.vectors for _ in v), sum(1 for v in ips[0].vectors for _ in v))
-                if ipc > ipfc:
-                    ips = [ip]
-                elif ipc == ipfc:
-                    ips.append(ip)
-
-            return ips
-
-        return functools.reduce(red_func, self.points.values(), [])
+    def get_top_list(self, k: int) -> list[IIntersectionPoint]:
+        """k largest points, the points of the equal size keep the order of adding"""
+        return heapq.nlargest(k, self.points.values(), key=lambda ip: ip.size)
 
     def get_largest(self, func: Callable[[list[Optional[IIntersectionPoint]]],
                                          Optional[IIntersectionPoint]] = random.choice
@@ -0,0 +1,133 @@
+# IDE: PyCharm
+# Project: games
+# Path: games/vector
+# File: lines.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-14 (y-m-d) 10:05 AM
+import functools
+from array import array
+from typing import Iterator
+
+"""
+    table = get_line_table(5, 4, 3)
+    for line_id in range(table.line_count):
+        table.get_line(line_id)  # offsets of the points: iy * size_x + ix
+    for window_id in range(table.window_count):
+        table.get_window(window_id)  # cnt_in_row offsets that can be a winning line
+    table.get_cell_lines(0)  # line ids that pass through a1 (the first point)
+"""
+
+
+class LineTable:
+    """
+        Immutable geometry of the board with size_x * size_y points for cnt_in_row.
+        Each point is addressed by offset iy * size_x + ix, where ix, iy are positions on the axes.
+        Lines are the rows, columns, back and forward diagonals (in that order and in the same order
+        as the vector providers walk them) that are not shorter than cnt_in_row.
+        Windows are all cnt_in_row long parts of the lines.
+        All data is kept in flat int arrays and exposed through read-only memoryview.
+    """
+
+    # steps (on axis positions) of row, column, back and forward diagonal
+    directions: tuple[tuple[int, int], ...] = ((1, 0), (0, 1), (1, 1), (-1, 1))
+
+    def __init__(self, size_x: int, size_y: int, cnt_in_row: int) -> None:
+        if size_x < 1 or size_y < 1 or cnt_in_row < 1:
+            raise ValueError(f'Sizes and cnt_in_row should be positive: {size_x}, {size_y}, {cnt_in_row}')
+        self.size_x = size_x
+        self.size_y = size_y
+        self.cnt_in_row = cnt_in_row
+
+        offsets, line_starts, line_directions = array('l'), array('l', [0]), array('b')
+        windows, window_lines = array('l'), array('l')
+        cell_lines = [[] for _ in range(size_x * size_y)]
+        cell_windows = [[] for _ in range(size_x * size_y)]
+        for direction, (ix, iy) in self._iter_line_starts():
+            dx, dy = self.directions[direction]
+            line = []
+            while 0 <= ix < size_x and 0 <= iy < size_y:
+                line.append(iy * size_x + ix)
+                ix, iy = ix + dx, iy + dy
+            if len(line) < cnt_in_row:
+                continue
+
+            line_id = len(line_directions)
+            for offset in line:
+                cell_lines[offset].append(line_id)
+            for i in range(len(line) - cnt_in_row + 1):
+                window_id = len(window_lines)
+                for offset in line[i:i + cnt_in_row]:
+                    cell_windows[offset].append(window_id)
+                windows.extend(line[i:i + cnt_in_row])
+                window_lines.append(line_id)
+
+            offsets.extend(line)
+            line_starts.append(len(offsets))
+            line_directions.append(direction)
+
+        self.__offsets = memoryview(offsets).toreadonly()
+        self.__line_starts = memoryview(line_starts).toreadonly()
+        self.__line_directions = memoryview(line_directions).toreadonly()
+        self.__windows = memoryview(windows).toreadonly()
+        self.__window_lines = memoryview(window_lines).toreadonly()
+        self.__cell_lines = tuple(tuple(ids) for ids in cell_lines)
+        self.__cell_windows = tuple(tuple(ids) for ids in cell_windows)
+
+    def _iter_line_starts(self) -> Iterator[tuple[int, tuple[int, int]]]:
+        """yields (direction, (ix, iy)) - the same start points as Row, Column and Diagonal VectorProvider do"""
+        for iy in range(self.size_y):
+            yield 0, (0, iy)
+        for ix in range(self.size_x):
+            yield 1, (ix, 0)
+        for ix in range(self.size_x):
+            yield 2, (ix, 0)
+        for iy in range(1, self.size_y):
+            yield 2, (0, iy)
+        for ix in reversed(range(self.size_x)):
+            yield 3, (ix, 0)
+        for iy in range(1, self.size_y):
+            yield 3, (self.size_x - 1, iy)
+
+    @property
+    def line_count(self) -> int:
+        return len(self.__line_directions)
+
+    @property
+    def window_count(self) -> int:
+        return len(self.__window_lines)
+
+    @property
+    def windows(self) -> memoryview:
+        """Offsets of all windows, window_id occupies [window_id * cnt_in_row: (window_id + 1) * cnt_in_row]"""
+        return self.__windows
+
+    def get_offset(self, ix: int, iy: int) -> int:
+        return iy * self.size_x + ix
+
+    def get_ixy(self, offset: int) -> tuple[int, int]:
+        iy, ix = divmod(offset, self.size_x)
+        return ix, iy
+
+    def get_line(self, line_id: int) -> memoryview:
+        return self.__offsets[self.__line_starts[line_id]:self.__line_starts[line_id + 1]]
+
+    def get_line_direction(self, line_id: int) -> int:
+        return self.__line_directions[line_id]
+
+    def get_window(self, window_id: int) -> memoryview:
+        return self.__windows[window_id * self.cnt_in_row:(window_id + 1) * self.cnt_in_row]
+
+    def get_window_line(self, window_id: int) -> int:
+        return self.__window_lines[window_id]
+
+    def get_cell_lines(self, offset: int) -> tuple[int, ...]:
+        return self.__cell_lines[offset]
+
+    def get_cell_windows(self, offset: int) -> tuple[int, ...]:
+        return self.__cell_windows[offset]
+
+
+@functools.lru_cache(maxsize=64)
+def get_line_table(size_x: int, size_y: int, cnt_in_row: int) -> LineTable:
+    """LineTable depends only on the shape, not on the items, so it is built once per shape and cnt_in_row"""
+    return LineTable(size_x, size_y, cnt_in_row)
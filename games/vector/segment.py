@@ -0,0 +1,85 @@
+# IDE: PyCharm
+# Project: games
+# Path: games/vector
+# File: segment.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-26 (y-m-d) 9:40 AM
+from collections.abc import Mapping
+from typing import Iterator, Optional
+
+from .lines import LineTable
+from ..board.board import IBoard
+from ..items.items import PItem, TPoint
+
+"""
+    table = get_line_table(5, 4, 3)
+    # b1, c1, d1 - the part of line 0 (the first row)
+    segment = Segment(board, 0, table.get_line(0)[1], 3, table.get_line_direction(0))
+    ('c', 1) in segment  # True
+    segment['c', 1]  # the item on c1 is read from the board right now
+    dict(segment)  # {('b', 1): None, ('c', 1): None, ('d', 1): None} - the same as TVector
+"""
+
+
+class Segment(Mapping):
+    """
+        Read-only TVector-like view of the length points of the line line_id that starts from the point
+        with offset start and goes in the direction (index in LineTable.directions). Items are taken from
+        the board on demand. Equality and hash are by identity (like the different dicts are different vectors).
+    """
+
+    __slots__ = ('board', 'line_id', 'start', 'length', 'direction')
+
+    def __init__(self, board: IBoard, line_id: int, start: int, length: int, direction: int) -> None:
+        self.board = board
+        self.line_id = line_id
+        self.start = start
+        self.length = length
+        self.direction = direction
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    @property
+    def delta(self) -> int:
+        """Offset distance between the neighbour points"""
+        dx, dy = LineTable.directions[self.direction]
+        return dy * len(self.board.axis_x) + dx
+
+    @property
+    def offsets(self) -> range:
+        if self.length <= 1:
+            # a single point has no step (forward diagonal of the board with one column has delta 0)
+            return range(self.start, self.start + self.length)
+        delta = self.delta
+        return range(self.start, self.start + self.length * delta, delta)
+
+    def get_point(self, offset: int) -> TPoint:
+        iy, ix = divmod(offset, len(self.board.axis_x))
+        return self.board.axis_x[ix], self.board.axis_y[iy]
+
+    def _find(self, point: TPoint) -> Optional[int]:
+        try:
+            offset = self.board.get_offset(*point)
+        except (ValueError, TypeError):
+            return None
+        return offset if offset in self.offsets else None
+
+    def __contains__(self, point: object) -> bool:
+        return self._find(point) is not None
+
+    def __getitem__(self, point: TPoint) -> Optional[PItem]:
+        offset = self._find(point)
+        if offset is None:
+            raise KeyError(point)
+        return self.board.get_at_offset(offset)
+
+    def __iter__(self) -> Iterator[TPoint]:
+        return map(self.get_point, self.offsets)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(line_id={self.line_id}, start={self.start}, ' \
+               f'length={self.length}, direction={self.direction})'
@@ -28,6 +28,9 @@ class IVectorPoints(Iterable):
 
 class VectorPoints(IVectorPoints):
 
+    # step (on axis positions) to the next point of the vector
+    step: Optional[tuple[int, int]] = None
+
     def __init__(self, board: IBoard, x: TPointX, y: TPointY, deep: Optional[int] = 1) -> None:
         self.board = board
         self.x = x
@@ -63,18 +66,47 @@ class VectorPoints(IVectorPoints):
         """default behaviour - not more than deep value and all if self.deep < 0."""
         return self.deep < 0 or self.deep - deep > 0
 
-    @abstractmethod
     def get_next_ixy(self, ix: int, iy: int) -> tuple[int, int]:
-        raise NotImplementedError
+        if self.step is None:
+            raise NotImplementedError('Must be reimplemented in descendants or pointed as class attribute step')
+        return ix + self.step[0], iy + self.step[1]
+
+    def get_steps_count(self, ix: int, iy: int, deep: int = 0) -> int:
+        """Returns the number of steps that can be done from ix, iy inside the board
+           (not more than self.deep - deep if self.deep >= 0)."""
+        result = [] if self.deep < 0 else [self.deep - deep]
+        for i, d, size in ((ix, self.step[0], len(self.board.axis_x)), (iy, self.step[1], len(self.board.axis_y))):
+            if d > 0:
+                result.append((size - 1 - i) // d)
+            elif d < 0:
+                result.append(i // -d)
+        return max(0, min(result))
+
+    def _walk_points(self, ix: int, iy: int, deep: int = 0) -> TVectorPoints:
+        """Point by point walk through get_next_ixy and is_sense_go_further"""
+        while True:
+            self.__points.append(self.get_point_xy(ix, iy))
+            if not self.is_sense_go_further(ix, iy, deep):
+                break
+            ix, iy = self.get_next_ixy(ix, iy)
+            if not (0 <= ix < len(self.board.axis_x) and 0 <= iy < len(self.board.axis_y)):
+                break
+            deep += 1
+        return self.points
 
     def _process_points(self, ix: int, iy: int, deep: int = 0) -> TVectorPoints:
-        self.__points.append(self.get_point_xy(ix, iy))
-        if self.is_sense_go_further(ix, iy, deep):
-            ix, iy = self.get_next_ixy(ix, iy)
-            if 0 <= ix < len(self.board.axis_x) and 0 <= iy < len(self.board.axis_y):
-                self._process_points(ix, iy, deep+1)
-        if deep == 0:
-            return self.points
+        """Computes the whole range of points at once if step is defined and the walk is not overridden"""
+        cls = type(self)
+        if self.step is None or cls.is_sense_go_further is not VectorPoints.is_sense_go_further \
+                or cls.get_next_ixy is not VectorPoints.get_next_ixy:
+            return self._walk_points(ix, iy, deep)
+
+        self.get_point_xy(ix, iy)  # only index validation of the start point
+        (dx, dy), axis_x, axis_y = self.step, self.board.axis_x, self.board.axis_y
+        self.__points.extend(
+            (axis_x[ix + i * dx], axis_y[iy + i * dy]) for i in range(self.get_steps_count(ix, iy, deep) + 1)
+        )
+        return self.points
 
     def get_points(self) -> TVectorPoints:
         if self.__points and self.__points[0] == (self.x, self.y):
@@ -92,26 +124,22 @@ class VectorPoints(IVectorPoints):
 
 class HorizontalVectorPoints(VectorPoints):
 
-    def get_next_ixy(self, ix: int, iy: int) -> tuple[int, int]:
-        return ix+1, iy
+    step = (1, 0)
 
 
 class VerticalVectorPoints(VectorPoints):
 
-    def get_next_ixy(self, ix: int, iy: int) -> tuple[int, int]:
-        return ix, iy+1
+    step = (0, 1)
 
 
 class BackDiagonalVectorPoints(VectorPoints):
 
-    def get_next_ixy(self, ix: int, iy: int) -> tuple[int, int]:
-        return ix+1, iy+1
+    step = (1, 1)
 
 
 class ForwardDiagonalVectorPoints(VectorPoints):
 
-    def get_next_ixy(self, ix: int, iy: int) -> tuple[int, int]:
-        return ix-1, iy+1
+    step = (-1, 1)
 
 
 class IVectorProvider(Iterable):
@@ -123,9 +151,12 @@ class IVectorProvider(Iterable):
     def provide(self) -> list[TVector]:
         raise NotImplementedError
 
+    def iter_vectors(self) -> Iterator[TVector]:
+        """Yields the vectors one by one, so the consumer that stops at the first hit doesn't build the rest"""
+        yield from self.provide()
+
     def __iter__(self) -> Iterator[TVector]:
-        for v in self.provide():
-            yield v
+        return self.iter_vectors()
 
 
 class VectorProvider(IVectorProvider):
@@ -146,11 +177,15 @@ class VectorProvider(IVectorProvider):
         result = [{(x, y): self.board[x, y] for x, y in vector_points}]
         return result
 
-    def provide(self) -> list[TVector]:
-        vectors = []
+    def provide_line(self, x: TPointX, y: TPointY) -> list[TVector]:
+        return self.extract_vectors(self.get_vector_points_class()(self.board, x, y, -1))
+
+    def iter_vectors(self) -> Iterator[TVector]:
         for x, y in self.provide_start_points():  # walk by rows
-            vectors.extend(self.extract_vectors(self.get_vector_points_class()(self.board, x, y, -1)))
-        return vectors
+            yield from self.provide_line(x, y)
+
+    def provide(self) -> list[TVector]:
+        return list(self.iter_vectors())
 
 
 class RowVectorProvider(VectorProvider):
@@ -197,11 +232,12 @@ class ForwardDiagonalVectorProvider(VectorProvider):
 
 class DiagonalsVectorProvider(IVectorProvider):
 
+    def iter_vectors(self) -> Iterator[TVector]:
+        yield from BackDiagonalVectorProvider(self.board).iter_vectors()
+        yield from ForwardDiagonalVectorProvider(self.board).iter_vectors()
+
     def provide(self) -> list[TVector]:
-        return [
-            *BackDiagonalVectorProvider(self.board).provide(),
-            *ForwardDiagonalVectorProvider(self.board).provide()
-        ]
+        return list(self.iter_vectors())
 
 
 class IRated(ABC):
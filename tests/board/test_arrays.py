@@ -0,0 +1,98 @@
+# IDE: PyCharm
+# Project: games
+# Path: tests/board
+# File: test_arrays.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-25 (y-m-d) 12:10 PM
+from unittest import TestCase, skipIf
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from games.board.axis import AsciiAxis, Int1Axis
+from games.board.bitboard import BitBoard
+from games.board.board import Board
+from games.board.arrays import get_window_sums, has_line, get_open_window_counts
+from games.items.items import XItem, OItem, BoardItem
+
+
+@skipIf(numpy is None, 'NumPy is not installed')
+class TestArrays(TestCase):
+    #  abcd
+    # 1X###
+    # 2#XO#
+    # 3##X#
+
+    def setUp(self) -> None:
+        self.board = Board(AsciiAxis(4), Int1Axis(3))
+        XItem(self.board, 'a', 1)
+        XItem(self.board, 'b', 2)
+        OItem(self.board, 'c', 2)
+        XItem(self.board, 'c', 3)
+
+    def test_as_array(self):
+        grid = self.board.as_array((XItem, OItem))
+        self.assertEqual(numpy.int8, grid.dtype)
+        self.assertListEqual([[1, 0, 0, 0], [0, 1, 2, 0], [0, 0, 1, 0]], grid.tolist())
+        with self.assertRaises(ValueError):
+            self.board.as_array((XItem, ))
+
+    def test_from_array(self):
+        grid = self.board.as_array((XItem, OItem))
+        board = BitBoard.from_array(AsciiAxis(4), Int1Axis(3), grid, (XItem, OItem))
+        self.assertIs(BitBoard, type(board))
+        self.assertEqual(self.board.zobrist_hash, board.zobrist_hash)
+        self.assertTrue(board.has_line(XItem, 3))
+        with self.assertRaises(ValueError):
+            Board.from_array(AsciiAxis(3), Int1Axis(3), grid, (XItem, OItem))
+
+    def test_from_array_codes(self):
+        grid = self.board.as_array((XItem, OItem))
+        grid[0, 1] = -1
+        with self.assertRaisesRegex(ValueError, 'Code -1'):
+            Board.from_array(AsciiAxis(4), Int1Axis(3), grid, (XItem, OItem))
+        grid[0, 1] = 3
+        with self.assertRaisesRegex(ValueError, 'Code 3'):
+            Board.from_array(AsciiAxis(4), Int1Axis(3), grid, (XItem, OItem))
+
+    def test_get_window_sums(self):
+        grid = self.board.as_array((XItem, OItem))
+        row, column, back, forward = get_window_sums(grid == 1, 3)
+        self.assertListEqual([[1, 0], [1, 1], [1, 1]], row.tolist())
+        self.assertListEqual([[1, 1, 1, 0]], column.tolist())
+        self.assertListEqual([[3, 0]], back.tolist())
+        self.assertListEqual([[1, 0]], forward.tolist())
+        self.assertTupleEqual((None, None, None), get_window_sums(grid == 1, 4)[1:])
+
+    def test_has_line(self):
+        grid = self.board.as_array((XItem, OItem))
+        self.assertTrue(has_line(grid, 1, 3))
+        self.assertFalse(has_line(grid, 2, 2))
+
+    def test_get_open_window_counts(self):
+        grid = self.board.as_array((XItem, OItem))
+        # open for O: b1-d1, d1-d3 (empty) and b1-d3, d1-b3 (one O)
+        self.assertListEqual([2, 2, 0, 0], get_open_window_counts(grid, 2, 3).tolist())
+        # a1-c3 is the only full window of X
+        self.assertEqual(1, get_open_window_counts(grid, 1, 3)[3])
+
+
+@skipIf(numpy is not None, 'NumPy is installed')
+class TestArraysWithoutNumpy(TestCase):
+
+    def test_as_array(self):
+        board = Board(AsciiAxis(3), Int1Axis(3))
+        BoardItem(board, 'a', 1)
+        with self.assertRaises(ImportError):
+            board.as_array((BoardItem, ))
+
+    def test_functions(self):
+        grid = [[1, 0], [0, 1]]
+        with self.assertRaises(ImportError):
+            get_window_sums(grid, 2)
+        with self.assertRaises(ImportError):
+            has_line(grid, 1, 2)
+        with self.assertRaises(ImportError):
+            get_open_window_counts(grid, 1, 2)
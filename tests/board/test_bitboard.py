@@ -0,0 +1,113 @@
+# IDE: PyCharm
+# Project: games
+# Path: tests/board
+# File: test_bitboard.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-12 (y-m-d) 8:15 PM
+from unittest import TestCase
+
+from games.board.axis import AsciiAxis, Int1Axis
+from games.board.bitboard import BitBoard
+from games.board.serializer import JSONBoardSerializer
+from games.items.items import XItem, OItem
+
+
+class TestBitBoard(TestCase):
+    #  abc
+    # 1X##
+    # 2#XO
+    # 3###
+
+    def setUp(self) -> None:
+        self.board = BitBoard(AsciiAxis(3), Int1Axis(3))
+        self.a1 = XItem(self.board, 'a', 1)
+        self.b2 = XItem(self.board, 'b', 2)
+        self.c2 = OItem(self.board, 'c', 2)
+
+    def test_get_bit(self):
+        self.assertEqual(0, self.board.get_bit('a', 1))
+        self.assertEqual(6, self.board.get_bit('c', 2))
+        with self.assertRaises(IndexError):
+            self.board.get_bit('d', 1)
+        with self.assertRaises(IndexError):
+            self.board.get_bit('a', 4)
+
+    def test_getitem(self):
+        self.assertIs(self.a1, self.board['a', 1])
+        self.assertIs(self.c2, self.board['c', 2])
+        self.assertIsNone(self.board['c', 3])
+        with self.assertRaises(IndexError):
+            _ = self.board['d', 1]
+
+    def test_delitem(self):
+        del self.board['b', 2]
+        self.assertIsNone(self.board['b', 2])
+        self.assertEqual(0b1, self.board.get_mask(XItem))
+        with self.assertRaises(KeyError):
+            del self.board['b', 2]
+
+    def test_get_mask(self):
+        self.assertEqual(0b100001, self.board.get_mask(XItem))
+        self.assertEqual(0b1000000, self.board.get_mask(OItem))
+        self.assertEqual(0b1100001, self.board.get_mask())
+        self.assertEqual(2, self.board.count(XItem))
+
+    def test_overwrite(self):
+        self.board['b', 2] = self.c2
+        self.assertEqual(0b1, self.board.get_mask(XItem))
+        self.assertEqual(0b1100000, self.board.get_mask(OItem))
+
+    def test_is_full(self):
+        self.assertFalse(self.board.is_full())
+        for x, y in self.board:
+            if self.board[x, y] is None:
+                OItem(self.board, x, y)
+        self.assertTrue(self.board.is_full())
+
+    def test_has_line(self):
+        self.assertFalse(self.board.has_line(XItem, 3))
+        self.assertTrue(self.board.has_line(XItem, 2))
+        XItem(self.board, 'c', 3)
+        self.assertTrue(self.board.has_line(XItem, 3))
+
+        # the guard bit prevents the row from wrapping: c1 + a2 is not a line
+        board = BitBoard(AsciiAxis(3), Int1Axis(3))
+        XItem(board, 'c', 1)
+        XItem(board, 'a', 2)
+        self.assertFalse(board.has_line(XItem, 2))
+
+    def test_get_column(self):
+        self.assertEqual((None, self.b2, None), self.board.get_column('b'))
+
+    def test_get_row(self):
+        self.assertEqual((None, self.b2, self.c2), self.board.get_row(2))
+
+    def test_serializer(self):
+        board = JSONBoardSerializer().loads(JSONBoardSerializer(self.board).dumps()).board
+        self.assertIs(BitBoard, type(board))
+        self.assertEqual(self.board.get_mask(XItem), board.get_mask(XItem))
+        self.assertEqual(self.board.get_mask(OItem), board.get_mask(OItem))
+
+    def test_bulk_load(self):
+        board = BitBoard.from_cells(AsciiAxis(3), Int1Axis(3), [XItem, None, None, None, XItem, OItem, None, None, None])
+        self.assertEqual(self.board.get_mask(XItem), board.get_mask(XItem))
+        self.assertEqual(self.board.get_mask(OItem), board.get_mask(OItem))
+        board.bulk_load([(('c', 3), XItem), (('c', 2), XItem)], replace=True)
+        self.assertTrue(board.has_line(XItem, 3))
+        self.assertEqual(0, board.get_mask(OItem))
+        self.assertIs(board['c', 3], board.get_row(3)[2])
+
+        # the last item of the point wins, the masks follow it
+        board.bulk_load([(('b', 1), OItem), (('b', 1), XItem)], replace=True)
+        self.assertIs(XItem, type(board['b', 1]))
+        self.assertEqual(0, board.get_mask(OItem))
+        self.assertEqual(5, board.count(XItem))
+
+    def test_set_at(self):
+        self.board.set_at(2, 2, XItem(BitBoard(AsciiAxis(3), Int1Axis(3)), 'c', 3))
+        self.assertTrue(self.board.has_line(XItem, 3))
+        self.board.delete_at(0, 0)
+        self.assertFalse(self.board.has_line(XItem, 3))
+        self.assertIsNone(self.board['a', 1])
+        with self.assertRaises(KeyError):
+            self.board.delete_at(0, 0)
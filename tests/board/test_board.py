@@ -11,7 +11,8 @@ from unittest import TestCase
 
 from games.board.axis import AsciiAxis, Int1Axis, IntAxis, FixedAxis
 from games.board.board import Board, ConsoleRenderer, HTMLRenderer
-from games.items.items import BoardItem
+from games.board.zobrist import ZobristKeys
+from games.items.items import BoardItem, XItem, OItem, ItemTriesToOccupyOccupiedPointError
 
 
 class TestBoard(TestCase):
@@ -37,12 +38,178 @@ class TestBoard(TestCase):
         with self.assertRaises(ValueError):
             self.std_board.index(object())
 
+        item = XItem(self.std_board, 'a', 1)
+        self.assertEqual(('a', 1), self.std_board.index(item))
+        self.std_board['b', 1] = BoardItem(Board(AsciiAxis(2), Int1Axis(2)), 'b', 1)
+        del self.std_board['a', 1]
+        with self.assertRaises(ValueError):
+            self.std_board.index(item)
+        self.assertEqual(('c', 2), self.std_board.index(self.item_c2))
+
+        # the same item on two points
+        self.std_board['d', 3] = self.item_c2
+        del self.std_board['c', 2]
+        self.assertEqual(('d', 3), self.std_board.index(self.item_c2))
+        del self.std_board['d', 3]
+        with self.assertRaises(ValueError):
+            self.std_board.index(self.item_c2)
+
+    def test_positions_of(self):
+        self.assertTupleEqual((('c', 2),), self.std_board.positions_of(BoardItem))
+        self.assertTupleEqual((), self.std_board.positions_of(XItem))
+        XItem(self.std_board, 'e', 3)
+        OItem(self.std_board, 'a', 1)
+        XItem(self.std_board, 'b', 1)
+        self.assertTupleEqual((('e', 3), ('b', 1)), self.std_board.positions_of(XItem))
+        self.std_board['e', 3] = OItem(Board(AsciiAxis(5), Int1Axis(3)), 'e', 3)
+        self.assertTupleEqual((('b', 1),), self.std_board.positions_of(XItem))
+        self.assertTupleEqual((('a', 1), ('e', 3)), self.std_board.positions_of(OItem))
+        self.std_board.bulk_load([(('b', 1), OItem)], replace=True)
+        self.assertTupleEqual((), self.std_board.positions_of(XItem))
+        self.assertEqual(3, len(self.std_board.positions_of(OItem)))
+
+        # the item that is set again on its point keeps its place
+        hash_value = self.std_board.zobrist_hash
+        self.std_board['a', 1] = self.std_board['a', 1]
+        self.assertTupleEqual((('a', 1), ('e', 3), ('b', 1)), self.std_board.positions_of(OItem))
+        self.assertEqual(hash_value, self.std_board.zobrist_hash)
+        self.assertEqual(('a', 1), self.std_board.index(self.std_board['a', 1]))
+
     def test_get_column(self):
         self.assertEqual((None, self.item_c2, None), self.std_board.get_column('c'))
 
     def test_get_row(self):
         self.assertEqual((None, None,self.item_c2, None, None), self.std_board.get_row(2))
 
+    def test_get_offset(self):
+        self.assertEqual(0, self.std_board.get_offset('a', 1))
+        self.assertEqual(7, self.std_board.get_offset('c', 2))
+
+    def test_zobrist_hash(self):
+        board = Board(AsciiAxis(3), Int1Axis(3))
+        self.assertEqual(0, board.zobrist_hash)
+        XItem(board, 'a', 1)
+        OItem(board, 'b', 2)
+        self.assertEqual(ZobristKeys.get_for(XItem)[0] ^ ZobristKeys.get_for(OItem)[4], board.zobrist_hash)
+
+        # the same position in the other order has the same hash
+        other = Board(AsciiAxis(3), Int1Axis(3))
+        OItem(other, 'b', 2)
+        XItem(other, 'a', 1)
+        self.assertEqual(board.zobrist_hash, other.zobrist_hash)
+
+        board['b', 2] = XItem(other, 'c', 3)
+        self.assertEqual(ZobristKeys.get_for(XItem)[0] ^ ZobristKeys.get_for(XItem)[4], board.zobrist_hash)
+        del board['b', 2]
+        del board['a', 1]
+        self.assertEqual(0, board.zobrist_hash)
+
+    def test_subscribe(self):
+        changes = []
+
+        class Listener:
+            def on_change(self, board, point):
+                changes.append((board, point))
+
+        listener = Listener()
+        self.std_board.subscribe(listener.on_change)
+        BoardItem(self.std_board, 'a', 1)
+        del self.std_board['c', 2]
+        self.assertListEqual([(self.std_board, ('a', 1)), (self.std_board, ('c', 2))], changes)
+
+        # the bound methods are not kept alive by the board
+        del listener
+        BoardItem(self.std_board, 'b', 1)
+        self.assertEqual(2, len(changes))
+
+        def on_change(board, point):
+            changes.append((board, point))
+
+        self.std_board.subscribe(on_change)
+        BoardItem(self.std_board, 'b', 2)
+        self.std_board.unsubscribe(on_change)
+        BoardItem(self.std_board, 'b', 3)
+        self.assertEqual(3, len(changes))
+
+    def test_bulk_load(self):
+        del self.std_board['c', 2]
+        changes = []
+        self.std_board.subscribe(lambda board, point: changes.append(point))
+        items = self.std_board.bulk_load([(('a', 1), XItem), (('c', 2), OItem), (('e', 3), XItem)])
+        self.assertListEqual([XItem, OItem, XItem], [type(item) for item in items])
+        self.assertIs(items[1], self.std_board['c', 2])
+        self.assertTupleEqual(('e', 3), (items[2].x, items[2].y))
+        self.assertListEqual([('a', 1), ('c', 2), ('e', 3)], changes)
+
+        other = Board(AsciiAxis(5), Int1Axis(3))
+        for point, item in self.std_board.items():
+            type(item)(other, *point)
+        self.assertEqual(other.zobrist_hash, self.std_board.zobrist_hash)
+
+        # nothing is placed if any point is wrong
+        with self.assertRaises(IndexError):
+            self.std_board.bulk_load([(('b', 1), XItem), (('z', 1), XItem)])
+        self.assertIsNone(self.std_board['b', 1])
+
+        # nothing is placed if any point is occupied on the board or twice in cells
+        with self.assertRaises(ItemTriesToOccupyOccupiedPointError):
+            self.std_board.bulk_load([(('b', 1), XItem), (('a', 1), OItem)])
+        with self.assertRaises(ItemTriesToOccupyOccupiedPointError):
+            self.std_board.bulk_load([(('b', 1), XItem), (('b', 1), OItem)])
+        self.assertIsNone(self.std_board['b', 1])
+        self.std_board.bulk_load([(('a', 1), OItem)], replace=True)
+        self.assertIs(OItem, type(self.std_board['a', 1]))
+
+    def test_from_cells(self):
+        board = Board.from_cells(AsciiAxis(2), Int1Axis(2), [XItem, None, None, OItem])
+        self.assertIs(XItem, type(board['a', 1]))
+        self.assertIs(OItem, type(board['b', 2]))
+        self.assertIsNone(board['b', 1])
+        self.assertEqual(ZobristKeys.get_for(XItem)[0] ^ ZobristKeys.get_for(OItem)[3], board.zobrist_hash)
+        with self.assertRaises(ValueError):
+            Board.from_cells(AsciiAxis(2), Int1Axis(2), [XItem])
+
+    def test_empty_count(self):
+        self.assertEqual(14, self.std_board.empty_count)
+        XItem(self.std_board, 'a', 1)
+        self.std_board['c', 2] = XItem(Board(AsciiAxis(5), Int1Axis(3)), 'c', 2)
+        self.assertEqual(13, self.std_board.empty_count)
+        del self.std_board['a', 1]
+        self.assertEqual(14, self.std_board.empty_count)
+
+    def test_random_empty_point(self):
+        board = Board(AsciiAxis(3), Int1Axis(2))
+        XItem(board, 'a', 1)
+        self.assertNotIn(board.random_empty_point(), (('a', 1), None))
+        XItem(board, 'b', 1)
+        board.bulk_load([(('c', 1), XItem), (('a', 2), XItem), (('b', 2), XItem)])
+        self.assertTupleEqual(('c', 2), board.random_empty_point())
+        XItem(board, 'c', 2)
+        self.assertIsNone(board.random_empty_point())
+        del board['b', 1]
+        self.assertTupleEqual(('b', 1), board.random_empty_point())
+        self.assertEqual(1, board.empty_count)
+
+    def test_get_at(self):
+        self.assertIs(self.item_c2, self.std_board.get_at(2, 1))
+        self.assertIs(self.item_c2, self.std_board.get_at_offset(7))
+        self.assertIsNone(self.std_board.get_at(0, 0))
+
+        changes = []
+        self.std_board.subscribe(lambda board, point: changes.append(point))
+        self.std_board.set_at(4, 2, XItem(Board(AsciiAxis(5), Int1Axis(3)), 'e', 3))
+        self.assertIs(XItem, type(self.std_board['e', 3]))
+        self.assertEqual(('e', 3), self.std_board.index(self.std_board['e', 3]))
+        self.std_board.delete_at(2, 1)
+        self.assertIsNone(self.std_board['c', 2])
+        self.assertListEqual([('e', 3), ('c', 2)], changes)
+        self.assertListEqual([('e', 3)], [point for point, _ in self.std_board.items()])
+
+    def test_iter_items(self):
+        items = self.std_board.iter_items()
+        self.assertTupleEqual((('c', 2), self.item_c2), next(items))
+        self.assertListEqual(list(self.std_board.items()), list(self.std_board.iter_items()))
+
 
 class TestConsoleRenderer(TestCase):
 
@@ -138,6 +138,13 @@ class TestAsciiAxis(TestCase):
         with self.assertRaises(ValueError):
             axis.index('h')
         self.assertEqual(len(axis)-1, axis.index('g'))
+        with self.assertRaises(ValueError):
+            axis.index(None)
+        self.assertNotIn(['a'], axis)
+        self.assertNotIn('h', axis)
+        axis.set_size(8)
+        self.assertIn('h', axis)
+        self.assertEqual(7, axis.index('h'))
 
 
 class TestFixedAxis(TestCase):
@@ -172,6 +179,11 @@ class TestFixedAxis(TestCase):
         with self.assertRaises(ValueError):
             axis.index(3)
         self.assertEqual(3, axis.get_max_size())
+        self.assertNotIn([1], axis)
+
+        axis.set_size(3)
+        self.assertIn(3, axis)
+        self.assertEqual(2, axis.index(3))
 
     def test_get_max_size(self):
         axis = FixedAxis(self.test_sequence)
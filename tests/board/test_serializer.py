@@ -4,11 +4,12 @@
 # File: ${FILE_NAME}
 # Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
 # Created by ox23 at 2022-06-22 (y-m-d) 11:30 AM
+import io
 from unittest import TestCase
 
 from games.board.axis import AsciiAxis, Int1Axis
-from games.board.serializer import Board, JSONBoardSerializer
-from games.items.items import XItem, OItem, BoardItem
+from games.board.serializer import Board, JSONBoardSerializer, BinaryBoardSerializer, ClassRegistry, class_registry
+from games.items.items import XItem, OItem, BoardItem, ItemTriesToOccupyOccupiedPointError
 
 
 class TestJSONBoardSerializer(TestCase):
@@ -101,3 +102,124 @@ class TestJSONBoardSerializer(TestCase):
         self.assertIs(type(board['a', 1]), XItem)
         self.assertIs(type(board['c', 2]), OItem)
         self.assertIs(type(board['b', 2]), BoardItem)
+        self.assertEqual(self.board.zobrist_hash, board.zobrist_hash)
+
+        # duplicated item line is not placed over the restored item
+        with self.assertRaises(ItemTriesToOccupyOccupiedPointError):
+            self.serializer.loads(
+                tstr + '\n{"class": "games.items.items.OItem", "args": [], "kwargs": {"x": "a", "y": 1}}'
+            )
+
+    def test_dump_load(self):
+        other = Board(AsciiAxis(2), Int1Axis(2))
+        OItem(other, 'b', 1)
+        fp = io.StringIO()
+        self.serializer.dump(fp)
+        JSONBoardSerializer(other).dump(fp)
+        self.assertEqual(self.serializer.dumps() + '\n\n', fp.getvalue()[:len(self.serializer.dumps()) + 2])
+
+        fp.seek(0)
+        serializer, read = JSONBoardSerializer(), []
+        items = serializer.iter_load(read.append(line) or line for line in fp)
+        self.assertIs(XItem, type(next(items)))
+        self.assertIs(XItem, type(serializer.board['a', 1]))
+        # the item is placed and yielded before the next line is read
+        self.assertEqual(2, len(read))
+        self.assertEqual(1, len(list(serializer.board.items())))
+        self.assertListEqual([OItem, BoardItem], [type(item) for item in items])
+
+        board = JSONBoardSerializer().load(fp).board
+        self.assertEqual(2, len(board.axis_x))
+        self.assertIs(OItem, type(board['b', 1]))
+        with self.assertRaises(EOFError):
+            JSONBoardSerializer().load(fp)
+
+
+class TestBinaryBoardSerializer(TestCase):
+
+    def setUp(self) -> None:
+        self.board = Board(AsciiAxis(3), Int1Axis(2))
+        self.x_item = XItem(self.board, 'a', 1)
+        self.o_item = OItem(self.board, 'c', 2)
+        self.board_item = BoardItem(self.board, 'b', 2)
+        self.serializer: BinaryBoardSerializer = BinaryBoardSerializer(self.board)
+
+    def test_dumps_loads(self):
+        data = self.serializer.dumps()
+        self.assertIsInstance(data, bytes)
+        for value in (data, memoryview(data), bytearray(data)):
+            board = BinaryBoardSerializer().loads(value).board
+            self.assertIs(Board, type(board))
+            self.assertIs(AsciiAxis, type(board.axis_x))
+            self.assertIs(Int1Axis, type(board.axis_y))
+            self.assertTupleEqual((3, 2), (len(board.axis_x), len(board.axis_y)))
+            self.assertIs(type(board['a', 1]), XItem)
+            self.assertIs(type(board['c', 2]), OItem)
+            self.assertIs(type(board['b', 2]), BoardItem)
+            self.assertEqual(3, len(list(board.items())))
+
+    def test_size(self):
+        board = Board(AsciiAxis(50), Int1Axis(50))
+        for i, (x, y) in enumerate(zip(board.axis_x, board.axis_y)):
+            (XItem if i % 2 else OItem)(board, x, y)
+        data = BinaryBoardSerializer(board).dumps()
+        self.assertLess(len(data), 625 + 150)  # points + header
+        board1 = BinaryBoardSerializer().loads(data).board
+        self.assertListEqual([(p, type(i)) for p, i in board.items()], [(p, type(i)) for p, i in board1.items()])
+
+    def test_errors(self):
+        data = bytearray(self.serializer.dumps())
+        data[2] = 99
+        with self.assertRaises(ValueError):
+            BinaryBoardSerializer().loads(data)
+
+        class YItem(XItem):
+            pass
+
+        YItem(self.board, 'a', 2)
+        with self.assertRaises(ValueError):
+            self.serializer.dumps()
+
+    def test_truncated(self):
+        data = self.serializer.dumps()
+        for size in (0, 5, 10, len(data) - 1):
+            with self.assertRaises(ValueError):
+                BinaryBoardSerializer().loads(data[:size])
+        with self.assertRaises(ValueError):
+            BinaryBoardSerializer().loads(data + b'\x00')
+        data = bytearray(data)
+        data[-1] = 0xff  # the codes of the points that are out of the board
+        with self.assertRaises(ValueError):
+            BinaryBoardSerializer().loads(data)
+
+    def test_limits(self):
+        with self.assertRaises(ValueError):
+            BinaryBoardSerializer(Board(AsciiAxis(1), Int1Axis(70000))).dumps()
+
+        board = Board(AsciiAxis(3), Int1Axis(2))
+        type('Item' + 'x' * 255, (XItem, ), {})(board, 'a', 2)
+        with self.assertRaisesRegex(ValueError, 'longer than 255'):
+            BinaryBoardSerializer(board).dumps()
+
+
+class TestClassRegistry(TestCase):
+
+    def test_resolve(self):
+        self.assertIs(XItem, class_registry.resolve('games.items.items.XItem'))
+        self.assertIs(AsciiAxis, class_registry.resolve('games.board.axis.AsciiAxis'))
+        with self.assertRaises(ModuleNotFoundError):
+            class_registry.resolve('os.system')
+        with self.assertRaises(ModuleNotFoundError):
+            JSONBoardSerializer()._loads_axis('{"class": "collections.OrderedDict", "args": [3], "kwargs": {}}')
+
+    def test_register(self):
+        registry = ClassRegistry(2)
+        registry.register(XItem, XItem, OItem)
+        self.assertEqual(2, len(registry))
+        self.assertIn('games.items.items.OItem', registry)
+        with self.assertRaises(ValueError):
+            registry.register(BoardItem)
+        registry.unregister(OItem)
+        self.assertNotIn('games.items.items.OItem', registry)
+        registry.register(BoardItem)
+        self.assertIs(BoardItem, registry.resolve('games.items.items.BoardItem'))
@@ -0,0 +1,58 @@
+# IDE: PyCharm
+# Project: games
+# Path: tests/board
+# File: test_symmetry.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-21 (y-m-d) 11:05 AM
+from unittest import TestCase
+
+from games.board.axis import AsciiAxis, Int1Axis
+from games.board.board import Board
+from games.board.symmetry import (get_symmetries, get_canonical, to_canonical_point, from_canonical_point,
+                                  transform)
+from games.items.items import XItem, OItem
+
+
+class TestSymmetry(TestCase):
+
+    def test_get_symmetries(self):
+        self.assertEqual(8, len(get_symmetries(3, 3)))
+        self.assertEqual(4, len(get_symmetries(4, 3)))
+        for symmetry in get_symmetries(4, 3) + get_symmetries(3, 3):
+            self.assertSetEqual(set(range(len(symmetry.perm))), set(symmetry.perm))
+            for offset in range(len(symmetry.perm)):
+                self.assertEqual(offset, symmetry.revert(symmetry.apply(offset)))
+
+        identity = get_symmetries(3, 3)[0]
+        self.assertTupleEqual(tuple(range(9)), identity.perm)
+        # mirror x on 4x3: a1 <-> d1
+        self.assertEqual(3, get_symmetries(4, 3)[1].apply(0))
+
+    def test_get_canonical(self):
+        hashes = set()
+        for x, y in (('a', 1), ('c', 1), ('a', 3), ('c', 3)):
+            b = Board(AsciiAxis(3), Int1Axis(3))
+            XItem(b, x, y)
+            OItem(b, 'b', 2)
+            canonical = get_canonical(b)
+            hashes.add(canonical.hash)
+            self.assertEqual(canonical.hash, transform(b, canonical.symmetry).zobrist_hash)
+        self.assertEqual(1, len(hashes))
+
+        b = Board(AsciiAxis(3), Int1Axis(3))
+        XItem(b, 'a', 2)
+        OItem(b, 'b', 2)
+        self.assertNotIn(get_canonical(b).hash, hashes)
+        self.assertIsNone(get_canonical(b, 1))
+
+    def test_canonical_point(self):
+        b = Board(AsciiAxis(4), Int1Axis(4))
+        XItem(b, 'd', 4)
+        canonical = get_canonical(b)
+        for x in b.axis_x:
+            for y in b.axis_y:
+                point = to_canonical_point(b, (x, y), canonical.symmetry)
+                self.assertTupleEqual((x, y), from_canonical_point(b, point, canonical.symmetry))
+        cb = transform(b, canonical.symmetry)
+        self.assertIsInstance(cb[to_canonical_point(b, ('d', 4), canonical.symmetry)], XItem)
+        self.assertEqual(1, len(list(cb.items())))
@@ -0,0 +1,45 @@
+# IDE: PyCharm
+# Project: games
+# Path: tests/board
+# File: test_zobrist.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-19 (y-m-d) 11:30 AM
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from games.board.zobrist import ZobristKeys
+from games.items.items import XItem, OItem
+
+
+class TestZobristKeys(TestCase):
+
+    def test_get(self):
+        self.assertIs(ZobristKeys.get('test'), ZobristKeys.get('test'))
+        self.assertIs(ZobristKeys.get('games.items.items.XItem'), ZobristKeys.get_for(XItem))
+        self.assertIsNot(ZobristKeys.get_for(OItem), ZobristKeys.get_for(XItem))
+
+    def test_getitem(self):
+        keys = ZobristKeys.get_for(XItem)
+        self.assertNotEqual(keys[0], keys[1])
+        self.assertLess(keys[1000], 1 << 64)
+        # keys are deterministic - they do not depend on the order or the process
+        self.assertEqual(ZobristKeys('games.items.items.XItem')[5], keys[5])
+        self.assertNotEqual(ZobristKeys.get_for(OItem)[5], keys[5])
+
+    def test_getitem_threads(self):
+        # the threads extend the keys at once from the different ends, each of them sees the same keys
+        # as the single thread of the other process would generate
+        keys, offsets = ZobristKeys('test.threads'), range(ZobristKeys.preallocated, ZobristKeys.preallocated + 5000)
+        barrier = threading.Barrier(4)
+
+        def get_keys(order):
+            barrier.wait()
+            return {offset: keys[offset] for offset in order}
+
+        orders = [offsets, offsets[::-1], offsets[::3], offsets[1::2]]
+        with ThreadPoolExecutor(4) as executor:
+            seen = list(executor.map(get_keys, orders))
+        expected = ZobristKeys('test.threads')
+        for order, thread_keys in zip(orders, seen):
+            self.assertDictEqual({offset: expected[offset] for offset in order}, thread_keys)
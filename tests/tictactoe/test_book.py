@@ -0,0 +1,126 @@
+# IDE: PyCharm
+# Project: games
+# Path: tests/tictactoe
+# File: test_book.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-20 (y-m-d) 6:40 PM
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from games.board.axis import AsciiAxis, Int1Axis
+from games.board.board import Board
+from games.items.items import XItem, OItem
+from games.tictactoe.book import MoveCache, build_book
+from games.tictactoe.player import TicTacToePlayerX, TicTacToePlayerY
+
+
+class TestMoveCache(TestCase):
+
+    def get_board(self, size=3):
+        return Board(AsciiAxis(size), Int1Axis(size))
+
+    def test_get_key_symmetric(self):
+        b1, b2 = self.get_board(), self.get_board()
+        XItem(b1, 'a', 1)
+        OItem(b1, 'b', 1)
+        XItem(b2, 'c', 3)
+        OItem(b2, 'c', 2)
+        cache = MoveCache()
+        self.assertEqual(cache.get_key(b1, 3, 'X')[0], cache.get_key(b2, 3, 'X')[0])
+        self.assertNotEqual(cache.get_key(b1, 3, 'X')[0], cache.get_key(b1, 3, 'O')[0])
+
+        OItem(b2, 'a', 1)
+        self.assertNotEqual(cache.get_key(b1, 3, 'X')[0], cache.get_key(b2, 3, 'X')[0])
+
+    def test_get_put(self):
+        b1, b2 = self.get_board(), self.get_board()
+        XItem(b1, 'a', 1)
+        XItem(b2, 'c', 3)
+        cache = MoveCache()
+        self.assertIsNone(cache.get(b1, 3, 'O'))
+        cache.put(b1, 3, 'O', ('b', 1))
+        self.assertTupleEqual(('b', 1), cache.get(b1, 3, 'O'))
+        # the same move mapped back to the rotated/reflected position
+        self.assertIn(cache.get(b2, 3, 'O'), (('b', 3), ('c', 2)))
+
+    def test_maxsize(self):
+        b = self.get_board()
+        cache = MoveCache(maxsize=2)
+        cache.put(b, 3, 'X', ('b', 2))
+        XItem(b, 'b', 2)
+        cache.put(b, 3, 'O', ('a', 1))
+        OItem(b, 'a', 1)
+        cache.put(b, 3, 'X', ('c', 3))
+        self.assertEqual(2, len(cache))
+        del b['a', 1], b['b', 2]
+        self.assertIsNone(cache.get(b, 3, 'X'))
+
+    def test_threads(self):
+        # the move put by one thread is seen by the threads that put and get the other positions meanwhile
+        center, corner, edge = self.get_board(), self.get_board(), self.get_board()
+        XItem(center, 'b', 2)
+        XItem(corner, 'a', 1)
+        XItem(edge, 'b', 1)
+        cache, barrier = MoveCache(maxsize=3), threading.Barrier(3)
+
+        def put_center():
+            barrier.wait()
+            cache.put(center, 3, 'O', ('a', 1))
+
+        def get_center(board):
+            barrier.wait()
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                cache.put(board, 3, 'O', ('c', 3))
+                point = cache.get(center, 3, 'O')
+                if point is not None:
+                    return point
+            return None
+
+        with ThreadPoolExecutor(3) as executor:
+            getters = [executor.submit(get_center, board) for board in (corner, edge)]
+            executor.submit(put_center).result()
+            self.assertListEqual([('a', 1), ('a', 1)], [getter.result() for getter in getters])
+        self.assertEqual(3, len(cache))
+        self.assertEqual(('c', 3), cache.get(corner, 3, 'O'))
+
+    def test_max_items(self):
+        b = self.get_board()
+        XItem(b, 'a', 1)
+        OItem(b, 'b', 2)
+        cache = MoveCache(max_items=1)
+        self.assertIsNone(cache.get_key(b, 3, 'X'))
+        cache.put(b, 3, 'X', ('c', 3))
+        self.assertEqual(0, len(cache))
+
+    def test_store(self):
+        with tempfile.TemporaryDirectory() as path:
+            path = os.path.join(path, 'book')
+            self.assertIsNone(MoveCache(path=path, flag='r').get(self.get_board(), 3, 'X'))
+
+            cache = MoveCache(path=path)
+            b = self.get_board()
+            cache.put(b, 3, 'X', ('b', 2), store=True)
+            cache.close()
+
+            cache = MoveCache(path=path, flag='r')
+            self.assertTupleEqual(('b', 2), cache.get(b, 3, 'X'))
+            cache.close()
+
+
+class TestBuildBook(TestCase):
+
+    def test_build_book(self):
+        cache = MoveCache()
+        res = build_book(lambda: Board(AsciiAxis(3), Int1Axis(3)), TicTacToePlayerX, TicTacToePlayerY, 3, 2, cache)
+        # the corner, the edge and the center up to symmetry
+        self.assertEqual(3, res)
+        self.assertEqual(3, len(cache))
+
+        b = Board(AsciiAxis(3), Int1Axis(3))
+        XItem(b, 'b', 2)
+        self.assertIsNotNone(cache.get(b, 3, 'O'))
@@ -58,6 +58,23 @@ class TestIntersectionPoints(TestCase):
         ips = IntersectionPoints.create(tprov)
         self.assertIn(ips.get_largest().point, (('b', 2), ('c', 2), ('b', 3), ('c', 3)))
 
+    def test_get_top_list(self):
+        ips = IntersectionPoints.create(self.provider)
+        self.assertListEqual([(('b', 2), 16), (('c', 1), 15), (('c', 3), 15)],
+                             [(ip.point, ip.size) for ip in ips.get_top_list(3)])
+        self.assertEqual(len(ips.points), len(ips.get_top_list(100)))
+        self.assertListEqual([], IntersectionPoints().get_top_list(3))
+
+    def test_size(self):
+        ips = IntersectionPoints.create(self.provider)
+        for ip in ips.points.values():
+            self.assertEqual(sum(len(v) for v in ip.vectors), ip.size)
+
+        ip = ips.points['b', 2]
+        ip.add(ip.vectors[0])
+        self.assertEqual(16, ip.size)
+        self.assertEqual(0, ip.clear().size)
+
     def test_parse_vectors(self):
         # 3 in row
         #  abcde
@@ -6,8 +6,12 @@
 # Created by ox23 at 2022-06-20 (y-m-d) 9:36 AM
 from unittest import TestCase
 
-from games.items.items import OItem
-from games.tictactoe.moves import TicTacToeIntersectionMove, TicTacToeWinMove, TicTacToeOpponentWinMove
+from games.board.axis import AsciiAxis, Int1Axis
+from games.board.board import Board
+from games.items.items import OItem, XItem
+from games.tictactoe.moves import (TicTacToeIntersectionMove, TicTacToeWinMove, TicTacToeOpponentWinMove,
+                                   TicTacToeDoubleThreatMove, TicTacToeIntersectionPoints)
+from games.tictactoe.vector import TicTacToeVectorProvider
 from tests.tictactoe.board_stubs import TicTacToeVectorProviderStub
 
 
@@ -20,6 +24,38 @@ class TestTicTacToeIntersectionMove(TestCase):
         self.assertIn(TicTacToeIntersectionMove(self.provider).resolve(), (('c', 1), ('c', 3)))
 
 
+class TestTicTacToeIntersectionPoints(TestCase):
+    # 3 in row
+    #  abcde
+    # 1#####
+    # 2#X#X#
+    # 3#X#O#
+    # 4##X##
+
+    def setUp(self) -> None:
+        self.ips = TicTacToeIntersectionPoints.create(TicTacToeVectorProviderStub().provider)
+
+    def test_calc_vector_rate(self):
+        # every point of the vector adds 20 whether it is empty or not
+        self.assertEqual(63, self.ips.calc_vector_rate({('a', 1): None, ('b', 1): None, ('c', 1): None}))
+        self.assertEqual(63, self.ips.calc_vector_rate({('a', 2): None, ('b', 2): object(), ('c', 2): None}))
+
+    def test_get_rates(self):
+        rates = self.ips.get_rates()
+        self.assertEqual(self.ips.points.keys(), rates.keys())
+        for point, ip in self.ips.points.items():
+            self.assertEqual(self.ips.calc_intersection_point_rate(ip), rates[point])
+        self.assertEqual(315, rates['c', 3])
+
+    def test_get_most_rated(self):
+        self.assertListEqual([('c', 1), ('c', 3)], [ip.point for ip in self.ips.get_most_rated()])
+        self.assertListEqual([], TicTacToeIntersectionPoints().get_most_rated())
+
+    def test_get_top_rated(self):
+        self.assertListEqual([('c', 1), ('c', 3), ('a', 1)], [ip.point for ip in self.ips.get_top_rated(3)])
+        self.assertEqual(len(self.ips.points), len(self.ips.get_top_rated(100)))
+
+
 class TestTicTacToeWinMove(TestCase):
     # 3 in row
     #  abcde
@@ -63,3 +99,62 @@ class TestTicTacToeOpponentWinMove(TestCase):
     def test_resolve(self):
         wr = TicTacToeOpponentWinMove(self.provider, OItem.id)
         self.assertIsNone(wr.resolve())
+
+
+class TestTicTacToeDoubleThreatMove(TestCase):
+    # 3 in row
+    #  abcd
+    # 1O###
+    # 2#X##
+    # 3###X
+    # 4####
+
+    def test_resolve(self):
+        board = Board(AsciiAxis(4), Int1Axis(4))
+        OItem(board, 'a', 1)
+        XItem(board, 'b', 2)
+        XItem(board, 'd', 3)
+        # X on b3 makes b1, b4 (column) and c3 (row), c2 and d2 make 3 winning points as well
+        self.assertIn(TicTacToeDoubleThreatMove(TicTacToeVectorProvider(board, XItem.id, 3)).resolve(),
+                      (('b', 3), ('c', 2), ('d', 2)))
+
+        board = Board(AsciiAxis(4), Int1Axis(1))
+        XItem(board, 'a', 1)
+        self.assertIsNone(TicTacToeDoubleThreatMove(TicTacToeVectorProvider(board, XItem.id, 3)).resolve())
+
+
+class SegmentVectorProvider(TicTacToeVectorProvider):
+    use_segments = True
+
+
+class TestSegmentVectors(TestCase):
+    # the moves with the vectors as Segment views (TicTacToeVectorProvider.use_segments)
+    #  abcde
+    # 1#####
+    # 2#X#X#
+    # 3#X#O#
+    # 4##X##
+
+    def setUp(self) -> None:
+        self.board = TicTacToeVectorProviderStub().board
+        self.provider = TicTacToeVectorProvider(self.board, XItem.id, 3)
+        self.segment_provider = SegmentVectorProvider(self.board, XItem.id, 3)
+
+    def test_provide(self):
+        self.assertListEqual([dict(v) for v in self.provider], [dict(v) for v in self.segment_provider])
+
+    def test_win_moves(self):
+        self.assertEqual(TicTacToeWinMove(self.provider).resolve(), TicTacToeWinMove(self.segment_provider).resolve())
+        self.assertIsNone(TicTacToeOpponentWinMove(self.segment_provider, OItem.id).resolve())
+        OItem(self.board, 'e', 2)
+        OItem(self.board, 'e', 1)
+        self.assertEqual(('e', 3), TicTacToeOpponentWinMove(self.segment_provider, OItem.id).resolve())
+
+    def test_double_threat_move(self):
+        self.assertEqual(TicTacToeDoubleThreatMove(self.provider).resolve(),
+                         TicTacToeDoubleThreatMove(self.segment_provider).resolve())
+
+    def test_intersection_move(self):
+        self.assertDictEqual(TicTacToeIntersectionPoints.create(self.provider).get_rates(),
+                             TicTacToeIntersectionPoints.create(self.segment_provider).get_rates())
+        self.assertIn(TicTacToeIntersectionMove(self.segment_provider).resolve(), (('c', 1), ('c', 3)))
@@ -6,7 +6,8 @@
 # Created by ox23 at 2022-06-10 (y-m-d) 5:18 AM
 from unittest import TestCase
 
-from games.tictactoe.player import TicTacToePlayerX, TicTacToePlayerY
+from games.items.items import XItem
+from games.tictactoe.player import TicTacToePlayerX, TicTacToePlayerY, PlayerWon, PlayerBoardFull
 
 from games.board.axis import AsciiAxis, Int1Axis
 from games.board.board import Board, ConsoleRenderer
@@ -51,6 +52,44 @@ class TestTicTacToePlayerX(TestCase):
     def test_cnt_in_row(self):
         self.assertEqual(3, self.player.cnt_in_row)
 
+    def test_get_won_line(self):
+        self.assertIsNone(self.player.get_won_line(self.board['b', 2]))
+        self.assertIsNone(self.player.get_won_line(self.board['d', 3]))
+
+        a1 = XItem(self.board, 'a', 1)
+        self.assertIsNone(self.player.get_won_line(a1))
+
+        b4 = XItem(self.board, 'b', 4)
+        self.assertEqual(
+            [(('b', 2), self.board['b', 2]), (('b', 3), self.board['b', 3]), (('b', 4), b4)],
+            self.player.get_won_line(b4)
+        )
+
+    def test_is_won(self):
+        self.assertFalse(self.player.is_won(self.board['d', 3]))
+        c3 = XItem(self.board, 'c', 3)
+        self.assertFalse(self.player.is_won(c3))
+
+        b4 = XItem(self.board, 'b', 4)
+        self.assertEqual(
+            [(('b', 2), self.board['b', 2]), (('b', 3), self.board['b', 3]), (('b', 4), b4)],
+            self.player.is_won(b4)
+        )
+        self.assertTrue(self.player.is_won())
+        with self.assertRaises(PlayerWon):
+            self.player.is_won(b4, True)
+
+    def test_is_board_full(self):
+        self.assertFalse(self.player.is_board_full(True))
+        board = Board(AsciiAxis(2), Int1Axis(1))
+        player = TicTacToePlayerX(board, 2)
+        XItem(board, 'a', 1)
+        self.assertFalse(player.is_board_full())
+        XItem(board, 'b', 1)
+        self.assertTrue(player.is_board_full())
+        with self.assertRaises(PlayerBoardFull):
+            player.is_board_full(True)
+
     def test_dynamical(self):
         axl, ayl, cntinrow = 3, 3, 3
         board = Board(AsciiAxis(axl), Int1Axis(ayl))
@@ -0,0 +1,69 @@
+# IDE: PyCharm
+# Project: games
+# Path: tests/tictactoe
+# File: test_scoring.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-16 (y-m-d) 4:40 PM
+from unittest import TestCase
+
+from games.board.axis import AsciiAxis, Int1Axis
+from games.board.board import Board
+from games.items.items import XItem, OItem
+from games.tictactoe.scoring import WindowScorer, LineScore
+
+
+class TestWindowScorer(TestCase):
+
+    def setUp(self) -> None:
+        self.board = Board(AsciiAxis(5), Int1Axis(1))
+        self.scorer = WindowScorer(XItem.id, 3)
+
+    def _line(self, *item_classes):
+        for x, item_class in zip(self.board.axis_x, item_classes):
+            if item_class is not None:
+                item_class(self.board, x, 1)
+        return [((x, 1), self.board[x, 1]) for x in self.board.axis_x]
+
+    def test_score_wins(self):
+        # X#XX#
+        score = self.scorer.score(self._line(XItem, None, XItem, XItem, None))
+        self.assertListEqual([('b', 1), ('e', 1)], score.wins)
+        self.assertTrue(score.is_open)
+
+    def test_score_makes(self):
+        # #X###
+        score = self.scorer.score(self._line(None, XItem, None, None, None))
+        self.assertListEqual([], score.wins)
+        self.assertFalse(score.is_open)
+        self.assertDictEqual({('a', 1): {('c', 1)}, ('c', 1): {('a', 1), ('d', 1)}, ('d', 1): {('c', 1)}},
+                             score.makes)
+        self.assertListEqual([('c', 1)], score.get_double_threats())
+
+    def test_score_opponent(self):
+        # #XO#X
+        score = self.scorer.score(self._line(None, XItem, OItem, None, XItem))
+        self.assertListEqual([], score.wins)
+        self.assertDictEqual({}, score.makes)
+
+        # the same line for O
+        score = WindowScorer(OItem.id, 2).score([((x, 1), self.board[x, 1]) for x in self.board.axis_x])
+        self.assertListEqual([('d', 1)], score.wins)
+
+    def test_update(self):
+        score = LineScore()
+        self.scorer.score(self._line(None, XItem, None, None, None), score)
+        x_item = XItem(self.board, 'a', 1)
+        self.scorer.score([(('a', 2), None), (('c', 1), None), (('b', 3), x_item)], score)
+        self.assertSetEqual({('a', 1), ('d', 1), ('a', 2)}, score.makes['c', 1])
+        self.assertListEqual([('c', 1)], score.get_double_threats())
+
+    def test_is_open(self):
+        # one winning point on each of two lines is not the open line
+        score = LineScore()
+        x_item = XItem(Board(AsciiAxis(1), Int1Axis(1)), 'a', 1)
+        self.scorer.score([(('a', 2), None), (('b', 2), x_item), (('c', 2), x_item)], score)
+        self.scorer.score([(('a', 3), x_item), (('b', 3), x_item), (('c', 3), None)], score)
+        self.assertListEqual([('a', 2), ('c', 3)], score.wins)
+        self.assertFalse(score.is_open)
+
+        self.assertTrue(score.update(self.scorer.score(self._line(None, XItem, XItem, None, None))).is_open)
@@ -0,0 +1,120 @@
+# IDE: PyCharm
+# Project: games
+# Path: tests/tictactoe
+# File: test_search.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-18 (y-m-d) 2:50 PM
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from games.board.axis import AsciiAxis, Int1Axis
+from games.board.board import Board
+from games.items.items import XItem, OItem
+from games.tictactoe.search import SearchState, TranspositionTable, TicTacToeSearchMove, OWN, OPPONENT, EMPTY
+from games.tictactoe.vector import TicTacToeVectorProvider
+from games.vector.lines import get_line_table
+
+
+class TestSearchState(TestCase):
+
+    def test_make_unmake(self):
+        table = get_line_table(3, 3, 3)
+        state = SearchState(table, [OWN, EMPTY, EMPTY, EMPTY, OPPONENT, EMPTY, EMPTY, EMPTY, EMPTY])
+        hash_, score = state.hash, state.score
+        self.assertFalse(state.make(1, OWN))
+        self.assertNotEqual(hash_, state.hash)
+        self.assertTrue(state.make(2, OWN))
+        state.unmake(2)
+        state.unmake(1)
+        self.assertEqual(hash_, state.hash)
+        self.assertEqual(score, state.score)
+        self.assertListEqual([OWN, EMPTY, EMPTY, EMPTY, OPPONENT, EMPTY, EMPTY, EMPTY, EMPTY], state.cells)
+
+    def test_get_candidates(self):
+        state = SearchState(get_line_table(4, 4, 3), [OWN] + [EMPTY] * 15)
+        self.assertSetEqual({1, 4, 5}, set(state.get_candidates()))
+
+
+class TestTranspositionTable(TestCase):
+
+    def test_put(self):
+        tt = TranspositionTable(2)
+        tt.put(1, 1, tt.EXACT, 10, None)
+        tt.put(2, 1, tt.EXACT, 20, None)
+        tt.put(1, 2, tt.EXACT, 11, None)
+        tt.put(3, 1, tt.EXACT, 30, None)
+        self.assertEqual(2, len(tt))
+        self.assertIsNone(tt.get(1))
+        self.assertEqual((1, tt.EXACT, 30, None), tt.get(3))
+
+    def test_put_threads(self):
+        # the concurrent puts lose no entry, and the eviction of the full table never drops more than one entry
+        def put(start, tt):
+            barrier.wait()
+            for key in range(start, start + 2000):
+                tt.put(key, 1, tt.EXACT, -key, None)
+
+        for maxsize, expected in ((8000, 8000), (100, 100)):
+            tt, barrier = TranspositionTable(maxsize), threading.Barrier(4)
+            with ThreadPoolExecutor(4) as executor:
+                list(executor.map(put, range(0, 8000, 2000), [tt] * 4))
+            self.assertEqual(expected, len(tt))
+            for key in tt.entries:
+                self.assertEqual((1, tt.EXACT, -key, None), tt.get(key))
+
+
+class TestTicTacToeSearchMove(TestCase):
+
+    def setUp(self) -> None:
+        self.board = Board(AsciiAxis(5), Int1Axis(5))
+        self.provider = TicTacToeVectorProvider(self.board, XItem.id, 4)
+
+    def test_resolve_win(self):
+        #  abcde
+        # 1#####
+        # 2#XXX#
+        # 3#OOO#
+        XItem(self.board, 'b', 2)
+        XItem(self.board, 'c', 2)
+        XItem(self.board, 'd', 2)
+        OItem(self.board, 'b', 3)
+        OItem(self.board, 'c', 3)
+        OItem(self.board, 'd', 3)
+        self.assertIn(TicTacToeSearchMove(self.provider, 2).resolve(), (('a', 2), ('e', 2)))
+
+    def test_resolve_block(self):
+        #  abcde
+        # 1X####
+        # 2#OOO#
+        # 3#####
+        XItem(self.board, 'a', 1)
+        OItem(self.board, 'b', 2)
+        OItem(self.board, 'c', 2)
+        OItem(self.board, 'd', 2)
+        XItem(self.board, 'e', 2)
+        self.assertEqual(('a', 2), TicTacToeSearchMove(self.provider, 2).resolve())
+
+    def test_tt_value(self):
+        search = TicTacToeSearchMove(self.provider, 4)
+        win = search.win_score
+        # the win 5 plies from the root found at ply 3 is the win 3 plies from the root at ply 1
+        self.assertEqual(win - 2, search._to_tt_value(win - 5, 3))
+        self.assertEqual(win - 3, search._from_tt_value(search._to_tt_value(win - 5, 3), 1))
+        self.assertEqual(-win + 3, search._from_tt_value(search._to_tt_value(-win + 5, 3), 1))
+        self.assertEqual(1000, search._from_tt_value(search._to_tt_value(1000, 3), 1))
+
+    def test_resolve_segments(self):
+        class SegmentVectorProvider(TicTacToeVectorProvider):
+            use_segments = True
+
+        XItem(self.board, 'a', 1)
+        OItem(self.board, 'b', 2)
+        OItem(self.board, 'c', 2)
+        OItem(self.board, 'd', 2)
+        XItem(self.board, 'e', 2)
+        provider = SegmentVectorProvider(self.board, XItem.id, 4)
+        self.assertEqual(('a', 2), TicTacToeSearchMove(provider, 2).resolve())
+
+    def test_resolve_empty_board(self):
+        self.assertIsNotNone(TicTacToeSearchMove(self.provider, 2).resolve())
@@ -8,10 +8,12 @@ from unittest import TestCase
 
 from games.tictactoe.vector import (
     TicTacToeRowVectorProvider, TicTacToeColumnVectorProvider, TicTacToeBackDiagonalVectorProvider,
-    TicTacToeForwardDiagonalVectorProvider
+    TicTacToeForwardDiagonalVectorProvider, TicTacToeVectorProvider
 )
+from games.vector.vector import VectorPoints
 from games.board.axis import AsciiAxis, Int1Axis
 from games.board.board import Board
+from games.items.items import OItem
 from tests.tictactoe.board_stubs import TicTacToeVectorProviderStub1
 
 
@@ -145,3 +147,82 @@ class TestTicTacToeVectorProvider(TestCase):
                  *self.provider_stub.diag_list, *self.provider_stub.diag_list_fwd)
         for v in self.provider_stub.provider:
             self.assertIn(v, ttres)
+
+    def test_on_board_changed(self):
+        #  abcde
+        # 1##O##
+        # 2#X#X#
+        # 3#X#O#
+        # 4##X##
+        provider = self.provider_stub.provider
+        vectors = provider.provide()
+        self.assertIs(vectors, provider.provide())
+
+        a4 = OItem(self.provider_stub.board, 'a', 4)
+        changed = provider.provide()
+        self.assertIsNot(vectors, changed)
+        self.assertNotIn({('a', 1): None, ('a', 2): None, ('a', 3): None, ('a', 4): None}, changed)
+        self.assertIn({('a', 1): None, ('a', 2): None, ('a', 3): None}, changed)
+        self.assertIn({('b', 4): None, ('c', 4): self.provider_stub.c4, ('d', 4): None, ('e', 4): None}, changed)
+        # the lines that do not pass through a4 are the same objects
+        self.assertIs(vectors[0], changed[0])
+
+        del self.provider_stub.board[a4.x, a4.y]
+        self.assertListEqual(vectors, provider.provide())
+        provider.clear_cache()
+        self.assertListEqual(vectors, provider.provide())
+
+    def test_iter_vectors(self):
+        provider = self.provider_stub.provider
+        first = next(provider.iter_vectors())
+        self.assertIs(first, next(provider.iter_vectors()))
+        self.assertListEqual(provider.provide(), list(provider.iter_vectors()))
+        self.assertListEqual(provider.provide(), list(provider))
+
+    def test_other_partial_providers(self):
+        class KnightVectorPoints(VectorPoints):
+            # step is not defined - the points are walked one by one
+            def get_next_ixy(self, ix: int, iy: int) -> tuple[int, int]:
+                return ix + 1, iy + 2
+
+        class KnightVectorProvider(TicTacToeRowVectorProvider):
+            vector_points_class = KnightVectorPoints
+
+            def provide_start_points(self):
+                return ((x, self.board.axis_y[0]) for x in self.board.axis_x)
+
+        class FirstRowVectorProvider(TicTacToeRowVectorProvider):
+            def provide_start_points(self):
+                return (point for i, point in enumerate(super().provide_start_points()) if i == 0)
+
+        class Provider(TicTacToeVectorProvider):
+            partial_vector_provider_classes = (FirstRowVectorProvider, KnightVectorProvider,
+                                               TicTacToeColumnVectorProvider)
+
+        board = self.provider_stub.board
+        provider = Provider(board, self.provider_stub.provider.item_id, 2)
+        expected = [*FirstRowVectorProvider(board, provider.item_id, 2).provide(),
+                    *KnightVectorProvider(board, provider.item_id, 2).provide(),
+                    *TicTacToeColumnVectorProvider(board, provider.item_id, 2).provide()]
+        self.assertListEqual(expected, provider.provide())
+        self.assertIn({('b', 1): None, ('c', 3): None}, provider.provide())
+
+        OItem(board, 'c', 3)
+        self.assertNotIn({('b', 1): None, ('c', 3): None}, provider.provide())
+
+    def test_extract_vectors_override(self):
+        class ItemsColumnVectorProvider(TicTacToeColumnVectorProvider):
+            # only the vectors with the items (columns a and e are dropped)
+            def extract_vectors(self, vector_points):
+                return [v for v in super().extract_vectors(vector_points) if any(v.values())]
+
+        class Provider(TicTacToeVectorProvider):
+            partial_vector_provider_classes = (ItemsColumnVectorProvider,)
+
+        board, item_id = self.provider_stub.board, self.provider_stub.provider.item_id
+        provider = Provider(board, item_id, 3)
+        self.assertIsNone(provider.get_line_direction(ItemsColumnVectorProvider(board, item_id, 3)))
+        self.assertEqual(1, provider.get_line_direction(TicTacToeColumnVectorProvider(board, item_id, 3)))
+        expected = ItemsColumnVectorProvider(board, item_id, 3).provide()
+        self.assertEqual(2, len(expected))
+        self.assertListEqual(expected, provider.provide())
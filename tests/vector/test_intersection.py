@@ -52,6 +52,18 @@ class TestIntersectionPoint(TestCase):
         self._init_intersection_point()
         self.assertEqual(4, len(self.intersection_point))
 
+    def test_contains(self):
+        ip = IntersectionPoint(('a', 1))
+        v1, v2 = {('a', 1): None, ('b', 1): None}, {('a', 1): None, ('b', 1): None}
+        ip.add(v1).add(v1)
+        self.assertIn(v1, ip)
+        self.assertNotIn(v2, ip)  # by identity, not by equality
+        ip.add(v2).add({('b', 1): None})
+        self.assertEqual(2, len(ip))
+        self.assertIs(v2, ip.vectors[1])
+        ip.clear()
+        self.assertNotIn(v1, ip)
+
 
 class TestIntersectionPoints(TestCase):
 
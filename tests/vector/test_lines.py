@@ -0,0 +1,58 @@
+# IDE: PyCharm
+# Project: games
+# Path: tests/vector
+# File: test_lines.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-14 (y-m-d) 11:20 AM
+from unittest import TestCase
+
+from games.vector.lines import LineTable, get_line_table
+
+
+class TestLineTable(TestCase):
+    #  abcd      offsets
+    # 1####    0  1  2  3
+    # 2####    4  5  6  7
+    # 3####    8  9 10 11
+
+    def setUp(self) -> None:
+        self.table = LineTable(4, 3, 3)
+
+    def test_lines(self):
+        lines = [tuple(self.table.get_line(i)) for i in range(self.table.line_count)]
+        self.assertListEqual(
+            [(0, 1, 2, 3), (4, 5, 6, 7), (8, 9, 10, 11),  # rows
+             (0, 4, 8), (1, 5, 9), (2, 6, 10), (3, 7, 11),  # columns
+             (0, 5, 10), (1, 6, 11),  # back diagonals
+             (3, 6, 9), (2, 5, 8)],  # forward diagonals
+            lines
+        )
+        self.assertListEqual([0, 0, 0, 1, 1, 1, 1, 2, 2, 3, 3],
+                             [self.table.get_line_direction(i) for i in range(self.table.line_count)])
+
+    def test_windows(self):
+        self.assertEqual(14, self.table.window_count)
+        self.assertEqual(14 * 3, len(self.table.windows))
+        self.assertTupleEqual((0, 1, 2), tuple(self.table.get_window(0)))
+        self.assertTupleEqual((1, 2, 3), tuple(self.table.get_window(1)))
+        self.assertEqual(0, self.table.get_window_line(1))
+        self.assertTupleEqual((2, 5, 8), tuple(self.table.get_window(13)))
+        self.assertEqual(10, self.table.get_window_line(13))
+
+    def test_cell_lines(self):
+        self.assertTupleEqual((1, 4, 7, 10), self.table.get_cell_lines(5))
+        self.assertTupleEqual((0, 6, 9), self.table.get_cell_lines(3))
+        self.assertTupleEqual((0, 1, 7, 11), self.table.get_cell_windows(1))
+
+    def test_offset(self):
+        self.assertEqual(6, self.table.get_offset(2, 1))
+        self.assertTupleEqual((2, 1), self.table.get_ixy(6))
+
+    def test_immutable(self):
+        with self.assertRaises(TypeError):
+            self.table.windows[0] = 1
+
+    def test_get_line_table(self):
+        self.assertIs(get_line_table(4, 3, 3), get_line_table(4, 3, 3))
+        self.assertIsNot(get_line_table(4, 3, 3), get_line_table(4, 3, 2))
+        self.assertEqual(0, get_line_table(2, 2, 3).line_count)
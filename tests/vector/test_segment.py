@@ -0,0 +1,84 @@
+# IDE: PyCharm
+# Project: games
+# Path: tests/vector
+# File: test_segment.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-26 (y-m-d) 11:15 AM
+from unittest import TestCase
+
+from games.board.axis import AsciiAxis, Int1Axis
+from games.board.board import Board
+from games.items.items import XItem, OItem
+from games.tictactoe.moves import TicTacToeWinMove
+from games.tictactoe.vector import TicTacToeVectorProvider
+from games.vector.segment import Segment
+from tests.tictactoe.board_stubs import TicTacToeVectorProviderStub
+
+
+class TestSegment(TestCase):
+    #  abcd      offsets
+    # 1####    0  1  2  3
+    # 2####    4  5  6  7
+    # 3####    8  9 10 11
+
+    def setUp(self) -> None:
+        self.board = Board(AsciiAxis(4), Int1Axis(3))
+        self.b1 = XItem(self.board, 'b', 1)
+
+    def test_mapping(self):
+        segment = Segment(self.board, 0, 1, 3, 0)
+        self.assertListEqual([('b', 1), ('c', 1), ('d', 1)], list(segment))
+        self.assertEqual(3, len(segment))
+        self.assertIn(('c', 1), segment)
+        self.assertNotIn(('a', 1), segment)
+        self.assertNotIn(('b', 2), segment)
+        self.assertNotIn(('z', 1), segment)
+        self.assertIs(self.b1, segment['b', 1])
+        with self.assertRaises(KeyError):
+            segment['a', 1]
+        self.assertDictEqual({('b', 1): self.b1, ('c', 1): None, ('d', 1): None}, dict(segment))
+
+        # items are read from the board on demand
+        c1 = OItem(self.board, 'c', 1)
+        self.assertIs(c1, segment['c', 1])
+
+    def test_directions(self):
+        self.assertListEqual([('a', 1), ('a', 2), ('a', 3)], list(Segment(self.board, 3, 0, 3, 1)))
+        self.assertListEqual([('b', 1), ('c', 2), ('d', 3)], list(Segment(self.board, 8, 1, 3, 2)))
+        self.assertListEqual([('d', 1), ('c', 2), ('b', 3)], list(Segment(self.board, 9, 3, 3, 3)))
+        self.assertNotIn(('a', 1), Segment(self.board, 9, 3, 3, 3))
+
+        # the only point of the forward diagonal of the board with one column, delta is 0
+        board = Board(AsciiAxis(1), Int1Axis(3))
+        self.assertEqual(0, Segment(board, 0, 0, 1, 3).delta)
+        self.assertListEqual([('a', 1)], list(Segment(board, 0, 0, 1, 3)))
+
+    def test_identity(self):
+        s1, s2 = Segment(self.board, 0, 1, 3, 0), Segment(self.board, 0, 1, 3, 0)
+        self.assertNotEqual(s1, s2)
+        self.assertEqual(s1, s1)
+        self.assertEqual(2, len({s1, s2}))
+        with self.assertRaises(AttributeError):
+            s1.other = 1
+
+
+class TestTicTacToeVectorProviderSegments(TestCase):
+
+    class Provider(TicTacToeVectorProvider):
+        use_segments = True
+
+    def test_provide(self):
+        stub = TicTacToeVectorProviderStub()
+        provider = self.Provider(stub.board, XItem.id, 3)
+        segments = provider.provide()
+        self.assertTrue(all(type(v) is Segment for v in segments))
+        self.assertListEqual(stub.provider.provide(), [dict(v) for v in segments])
+
+        # lines through the changed point are recomputed
+        OItem(stub.board, 'c', 3)
+        self.assertListEqual(stub.provider.provide(), [dict(v) for v in provider.provide()])
+
+    def test_win_move(self):
+        stub = TicTacToeVectorProviderStub()
+        self.assertEqual(TicTacToeWinMove(stub.provider).resolve(),
+                         TicTacToeWinMove(self.Provider(stub.board, XItem.id, 3)).resolve())
@@ -6,7 +6,7 @@
 # Created by ox23 at 2022-06-15 (y-m-d) 9:24 PM
 from unittest import TestCase
 
-from games.board.axis import AsciiAxis, Int1Axis
+from games.board.axis import AsciiAxis, Int1Axis, IntAxis
 from games.board.board import Board
 from games.vector.vector import (HorizontalVectorPoints, VerticalVectorPoints, BackDiagonalVectorPoints,
                                  ForwardDiagonalVectorPoints, RowVectorProvider, ColumnVectorProvider,
@@ -54,6 +54,41 @@ class TestHorizontalVectorPoints(TestCase):
         self.assertListEqual(points.get_points(), [('a', 1), ('b', 1), ('c', 1), ('d', 1)])
 
 
+class TestVectorPoints(TestCase):
+
+    def test_large_board(self):
+        board = Board(IntAxis(5000), IntAxis(5000))
+        points = BackDiagonalVectorPoints(board, 0, 0, -1)
+        self.assertEqual(5000, len(points.get_points()))
+        self.assertEqual((4999, 4999), points.get_points()[-1])
+        points = ForwardDiagonalVectorPoints(board, 4999, 10, 100)
+        self.assertEqual(101, len(points.get_points()))
+        self.assertEqual((4899, 110), points.get_points()[-1])
+
+    def test_walk_points(self):
+        # the overrides of the walk are honoured while the step is still set
+        class KnightVectorPoints(HorizontalVectorPoints):
+            def get_next_ixy(self, ix: int, iy: int) -> tuple[int, int]:
+                return ix + 2, iy + 1
+
+        class SkipVectorPoints(HorizontalVectorPoints):
+            def get_next_ixy(self, ix: int, iy: int) -> tuple[int, int]:
+                return ix + 2, iy
+
+        class StopVectorPoints(HorizontalVectorPoints):
+            def is_sense_go_further(self, ix: int, iy: int, deep: int) -> bool:
+                return ix < 2 and super().is_sense_go_further(ix, iy, deep)
+
+        board = Board(AsciiAxis(5), Int1Axis(4))
+        self.assertListEqual([('a', 1), ('c', 2), ('e', 3)], KnightVectorPoints(board, 'a', 1, -1).get_points())
+        self.assertListEqual([('a', 1), ('c', 2)], KnightVectorPoints(board, 'a', 1).get_points())
+        self.assertListEqual([], KnightVectorPoints(board, 'a', 1, 3).get_points())
+        self.assertListEqual([('a', 1), ('c', 1), ('e', 1)], SkipVectorPoints(board, 'a', 1, -1).get_points())
+        self.assertListEqual([('a', 1), ('b', 1), ('c', 1)], StopVectorPoints(board, 'a', 1, -1).get_points())
+        self.assertListEqual([('a', 1), ('b', 1), ('c', 1), ('d', 1), ('e', 1)],
+                             HorizontalVectorPoints(board, 'a', 1, -1).get_points())
+
+
 class TestVerticalVectorPoints(TestCase):
 
     def setUp(self) -> None:
@@ -256,6 +291,11 @@ class TestDiagonalsVectorProvider(TestCase):
             {('e', 4): None},
         ]
         self.assertListEqual(tres, self.provider.provide())
+        self.assertListEqual(tres, list(self.provider))
+
+        vectors = self.provider.iter_vectors()
+        self.assertDictEqual(tres[0], next(vectors))
+        self.assertDictEqual(tres[1], next(vectors))
 
 
 class TestIntersectionPoint(TestCase):
@@ -2,17 +2,25 @@ from django.contrib import admin
 
 # Register your models here.
 
-from .models import ActiveGame, GameBoard
+from .models import ActiveGame, GameBoard, GameMove
 
 
 class GameBoardAdmin(admin.ModelAdmin):
     pass
 
+
 admin.site.register(GameBoard, GameBoardAdmin)
 
 
 class ActiveGameAdmin(admin.ModelAdmin):
     pass
 
+
 admin.site.register(ActiveGame, ActiveGameAdmin)
 
+
+class GameMoveAdmin(admin.ModelAdmin):
+    list_display = ('board', 'ply', 'item_class', 'offset', 'created')
+
+
+admin.site.register(GameMove, GameMoveAdmin)
@@ -0,0 +1,6 @@
+# IDE: PyCharm
+# Project: games
+# Path: web_games/management/commands
+# File: __init__.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-20 (y-m-d) 7:02 PM
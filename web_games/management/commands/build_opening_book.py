@@ -0,0 +1,50 @@
+# IDE: PyCharm
+# Project: games
+# Path: web_games/management/commands
+# File: build_opening_book.py
+# Contact: Semyon Mamonov <semyon.mamonov@gmail.com>
+# Created by ox23 at 2022-07-20 (y-m-d) 7:05 PM
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from games.board.axis import AsciiAxis, Int1Axis
+from games.board.board import Board
+from games.tictactoe.book import MoveCache, build_book
+
+from ...game_manager import TicTacToeGameSite
+from ...utils import get_game_site_manager
+
+"""
+    python manage.py build_opening_book 15 15 5 --plies 4
+"""
+
+
+class Command(BaseCommand):
+    help = 'Pre-generates the bot replies for the first plies of the Tic Tac Toe games into the opening book'
+
+    def add_arguments(self, parser):
+        parser.add_argument('size_x', type=int)
+        parser.add_argument('size_y', type=int)
+        parser.add_argument('cnt_in_row', type=int)
+        parser.add_argument('--plies', type=int, default=2, help='Number of plies (the moves of both players)')
+        parser.add_argument('--path', default=None, help='Path of the book, default is settings.WEB_GAMES_OPENING_BOOK')
+
+    def handle(self, *args, **options):
+        path = options['path'] or getattr(settings, 'WEB_GAMES_OPENING_BOOK', None)
+        if not path:
+            raise CommandError('Path of the book should be passed as --path or settings.WEB_GAMES_OPENING_BOOK')
+
+        size_x, size_y = options['size_x'], options['size_y']
+        site = get_game_site_manager()[TicTacToeGameSite.uuid]
+        player_classes = site.player_classes
+        cache = MoveCache(path=str(path))
+        try:
+            for player_class in player_classes:
+                for bot_class in (cls for cls in player_classes if cls is not player_class):
+                    cnt = build_book(
+                        lambda: Board(AsciiAxis(size_x), Int1Axis(size_y)),
+                        player_class, bot_class, options['cnt_in_row'], options['plies'], cache
+                    )
+                    self.stdout.write(f'{bot_class.__name__} replies to {player_class.__name__}: {cnt} positions')
+        finally:
+            cache.close()
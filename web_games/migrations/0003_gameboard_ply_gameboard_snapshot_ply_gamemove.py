@@ -0,0 +1,39 @@
+# Generated by Django 4.0.5 on 2022-07-22 11:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web_games', '0002_remove_activegame_player_activegame_player_class_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboard',
+            name='ply',
+            field=models.PositiveIntegerField(default=0, verbose_name='Number of moves'),
+        ),
+        migrations.AddField(
+            model_name='gameboard',
+            name='snapshot_ply',
+            field=models.PositiveIntegerField(default=0, verbose_name='Number of moves in the serialized board'),
+        ),
+        migrations.CreateModel(
+            name='GameMove',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ply', models.PositiveIntegerField(verbose_name='Move number')),
+                ('offset', models.PositiveIntegerField(verbose_name='Offset of the point on the board')),
+                ('item_class', models.CharField(max_length=255, verbose_name='Item class')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Created')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='moves', to='web_games.gameboard')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='gamemove',
+            constraint=models.UniqueConstraint(fields=('board', 'ply'), name='unique_game_move_ply'),
+        ),
+    ]
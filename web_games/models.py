@@ -1,14 +1,90 @@
-from django.db import models
+from datetime import datetime
+from typing import Optional
+
+from django.db import models, transaction
 from django.utils.translation import gettext as _
 
+from games.board.board import Board
+from games.board.serializer import JSONBoardSerializer, ClassRegistry, class_registry
+from games.items.items import TPoint
+
 # Create your models here.
 
 
+class GameBoardChanged(Exception):
+    """The moves of the game were saved by another request after the board had been read"""
+
+
 class GameBoard(models.Model):
     data = models.TextField(verbose_name=_('Serialized last state of game\'s board.'))
     created = models.DateTimeField(verbose_name=_('Created'), blank=True, auto_now_add=True)
     modified = models.DateTimeField(verbose_name=_('Modified'), blank=True, auto_now=True)
     completed = models.DateTimeField(verbose_name=_('Completed'), blank=True, null=True, default=None)
+    ply = models.PositiveIntegerField(verbose_name=_('Number of moves'), default=0)
+    snapshot_ply = models.PositiveIntegerField(verbose_name=_('Number of moves in the serialized board'), default=0)
+
+    # data is rewritten after each snapshot_every moves, other moves are only appended to the move log
+    snapshot_every = 16
+
+    def get_board(self) -> Board:
+        """Board from the last snapshot (data) with the moves made after it"""
+        board = JSONBoardSerializer(None).loads(self.data).board
+        for move in self.moves.filter(ply__gte=self.snapshot_ply).order_by('ply'):
+            move.place(board)
+        return board
+
+    def save_moves(self, board: Board, points: list[TPoint], completed: Optional[datetime] = None) -> None:
+        """
+            Appends the items on the points of board (in order) to the move log.
+            The board row is locked while the moves are stored, so the requests of the same game (e.g. a double
+            submit) are applied one after another and the late one raises GameBoardChanged instead of IntegrityError.
+        """
+        with transaction.atomic():
+            ply = GameBoard.objects.select_for_update().values_list('ply', flat=True).get(pk=self.pk)
+            if ply != self.ply:
+                raise GameBoardChanged(f'Game board {self.pk} has {ply} moves, {self.ply} are expected')
+
+            GameMove.objects.bulk_create(
+                [GameMove(board=self, ply=self.ply + i, offset=board.get_offset(*point),
+                          item_class=GameMove.get_item_class_path(board[point]))
+                 for i, point in enumerate(points)]
+            )
+            self.ply += len(points)
+            update_fields = ['ply', 'modified']
+            if self.ply - self.snapshot_ply >= self.snapshot_every:
+                self.data = JSONBoardSerializer(board).dumps()
+                self.snapshot_ply = self.ply
+                update_fields.extend(('data', 'snapshot_ply'))
+            if completed is not None:
+                self.completed = completed
+                update_fields.append('completed')
+            self.save(update_fields=update_fields)
+
+
+class GameMove(models.Model):
+    board = models.ForeignKey(GameBoard, on_delete=models.CASCADE, related_name='moves')
+    ply = models.PositiveIntegerField(verbose_name=_('Move number'))
+    offset = models.PositiveIntegerField(verbose_name=_('Offset of the point on the board'))
+    item_class = models.CharField(max_length=255, verbose_name=_('Item class'))
+    created = models.DateTimeField(verbose_name=_('Created'), blank=True, auto_now_add=True)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=['board', 'ply'], name='unique_game_move_ply')]
+
+    @staticmethod
+    def get_item_class_path(item) -> str:
+        return ClassRegistry.get_path(type(item))
+
+    def get_point(self, board: Board) -> TPoint:
+        iy, ix = divmod(self.offset, len(board.axis_x))
+        return board.axis_x[ix], board.axis_y[iy]
+
+    def place(self, board: Board):
+        """item_class is resolved through class_registry as the serialized board, unregistered class raises"""
+        return class_registry.resolve(self.item_class)(board, *self.get_point(board))
+
+    def __str__(self):
+        return f'{self.board_id}:{self.ply}:{self.item_class}[{self.offset}]'
 
 
 class ActiveGame(models.Model):
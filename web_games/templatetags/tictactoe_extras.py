@@ -15,7 +15,6 @@ from games.renderer.renderer import HTMLRender
 from games.tictactoe.player import ITicTacToePlayer
 from ..models import GameBoard, ActiveGame
 from games.board.board import HTMLRenderer, IBoard
-from games.board.serializer import JSONBoardSerializer
 from ..utils import get_module_attr
 
 register = template.Library()
@@ -31,7 +30,7 @@ class GameBoardHTMLRenderer(HTMLRenderer):
         if isinstance(game_board, GameBoard):
             self.board_id = self.board_id_str % game_board.pk
             self.game_board = game_board
-            board = JSONBoardSerializer(None).loads(game_board.data).board
+            board = game_board.get_board()
         super().__init__(board)
 
     def get_board_renderer(self, rows: list[HTMLRender]):
@@ -58,7 +57,7 @@ def render_activegame(context, activegame: ActiveGame,
 
     if player is None:
         # reconstruct board
-        board = JSONBoardSerializer(None).loads(activegame.board.data).board
+        board = activegame.board.get_board()
 
         # reconstruct the current player
         player_class = globals().get(activegame.player_class)
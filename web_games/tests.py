@@ -1,3 +1,44 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
+
+from games.board.axis import AsciiAxis, Int1Axis
+from games.board.board import Board
+from games.board.serializer import JSONBoardSerializer
+from games.items.items import XItem, OItem
+
+from .models import GameBoard, GameBoardChanged, GameMove
 
 # Create your tests here.
+
+
+class TestGameMove(SimpleTestCase):
+
+    def test_place(self):
+        board = Board(AsciiAxis(3), Int1Axis(3))
+        item = GameMove(offset=4, item_class='games.items.items.XItem').place(board)
+        self.assertIs(XItem, type(item))
+        self.assertIs(item, board['b', 2])
+
+        # only the classes from games.board.serializer.class_registry can be placed
+        with self.assertRaises(ModuleNotFoundError):
+            GameMove(offset=0, item_class='web_games.models.GameBoard').place(board)
+        self.assertIsNone(board['a', 1])
+
+
+class TestGameBoard(TestCase):
+
+    def test_save_moves(self):
+        board = Board(AsciiAxis(3), Int1Axis(3))
+        game_board = GameBoard.objects.create(data=JSONBoardSerializer(board).dumps())
+        # the same game is read by two requests
+        other = GameBoard.objects.get(pk=game_board.pk)
+
+        XItem(board, 'a', 1)
+        OItem(board, 'b', 2)
+        game_board.save_moves(board, [('a', 1), ('b', 2)])
+        self.assertEqual(2, GameBoard.objects.get(pk=game_board.pk).ply)
+
+        with self.assertRaises(GameBoardChanged):
+            other.save_moves(board, [('a', 1)])
+        self.assertEqual(2, game_board.moves.count())
+        self.assertIsInstance(game_board.get_board()['b', 2], OItem)
+
@@ -10,21 +10,30 @@ import json
 from datetime import datetime
 from typing import Type
 
-from django.http import HttpRequest
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.views import View
 from django.views.generic import FormView, ListView, DeleteView
 
 from games.board.serializer import JSONBoardSerializer
+from games.tictactoe.book import MoveCache
 from games.tictactoe.player import ITicTacToePlayer, PlayerWon
 
 from ..utils import get_module_attr, get_game_site_manager
 from ..forms.tictactoe import TicTacToePlayersNextMoveForm, TicTacToeCreateForm
-from ..models import ActiveGame, GameBoard
+from ..models import ActiveGame, GameBoard, GameBoardChanged
 
 GAME_SESSION_COOKIE_NAME = 'game_sessionid'
 
+# process wide cache of the bot's replies, backed by the opening book (read only)
+BOT_MOVE_CACHE = MoveCache(
+    path=getattr(settings, 'WEB_GAMES_OPENING_BOOK', None),
+    max_items=getattr(settings, 'WEB_GAMES_MOVE_CACHE_MAX_ITEMS', None),
+    flag='r'
+)
+
 
 class GameViewMixin(View):
 
@@ -52,7 +61,7 @@ class TicTacToePlayView(GameViewMixin, FormView):
         gsid = self.request.session.session_key
         ag = get_object_or_404(ActiveGame.objects.filter(pk=pk, game_uuid=game_uuid, gsid=gsid))
         self.active_game_object = ag
-        board = JSONBoardSerializer(None).loads(ag.board.data).board
+        board = ag.board.get_board()
 
         pcls = globals().get(ag.player_class)
         if pcls is None:
@@ -66,6 +75,7 @@ class TicTacToePlayView(GameViewMixin, FormView):
         site = self.get_site()
         pcls = [cls for cls in site.player_classes if cls is not type(self._player)][0]
         res = pcls(self._player.board, self._player.cnt_in_row)
+        res.move_cache = BOT_MOVE_CACHE
         return res
 
     def setup(self, request, *args, **kwargs):
@@ -89,14 +99,16 @@ class TicTacToePlayView(GameViewMixin, FormView):
     def form_valid(self, form):
         game_is_complete = False
 
+        moves = [form.cleaned_data['move_to']]
         try:
-            self._player.play(*form.cleaned_data['move_to'])
+            self._player.play(*moves[0])
         except PlayerWon:
             game_is_complete = True
 
         # bot
         if not self._opponent_player.is_board_full() and not game_is_complete:
             opponent_move = self._opponent_player.move_suggestion()
+            moves.append(opponent_move)
             try:
                 self._opponent_player.play(*opponent_move)
             except PlayerWon:
@@ -104,11 +116,14 @@ class TicTacToePlayView(GameViewMixin, FormView):
         # end-bot
 
         # store all changes
-        self.active_game_object.board.data = JSONBoardSerializer(self._player.board).dumps()
+        completed = None
         if game_is_complete or self._player.is_board_full():
-            self.active_game_object.board.completed = datetime.now()
+            completed = datetime.now()
 
-        self.active_game_object.board.save()
+        try:
+            self.active_game_object.board.save_moves(self._player.board, moves, completed)
+        except GameBoardChanged:
+            return HttpResponse(status=409)  # the move was already made by another request of this game
         return super().form_valid(form)
 
     def get_context_data(self, **kwargs):